@@ -0,0 +1,45 @@
+## _assets_readme.py
+python
+"""
+Placeholder README written to assets/ by setup_enhanced_game.py.
+"""
+
+README = b"""# Assets Directory
+
+This directory contains game assets:
+
+## Images (assets/images/)
+- player.png - Player spaceship sprite
+- enemy_*.png - Enemy sprites
+- bullet.png - Bullet sprite
+- powerup_*.png - Power-up sprites
+- background_*.png - Background images
+- icon.png - Game icon
+
+## Sounds (assets/sounds/)
+- menu_music.ogg - Main menu background music
+- game_music.ogg - Gameplay background music
+- boss_music.ogg - Boss battle music
+- shoot.wav - Shooting sound effect
+- explosion.wav - Explosion sound effect
+- powerup.wav - Power-up collection sound
+- menu_select.wav - Menu selection sound
+- menu_hover.wav - Menu hover sound
+- game_over.wav - Game over sound
+- level_complete.wav - Level completion sound
+- boss_warning.wav - Boss warning sound
+
+## Fonts (assets/fonts/)
+- game_font.ttf - Main game font
+
+## Notes
+- The game will work without these assets using built-in placeholders
+- For the best experience, add high-quality assets
+- Supported image formats: PNG, JPG, BMP
+- Supported audio formats: WAV, OGG, MP3
+- Recommended image sizes:
+  - Player: 40x40 pixels
+  - Enemies: 30x30 to 80x80 pixels
+  - Bullets: 4x10 pixels
+  - Power-ups: 24x24 pixels
+"""
@@ -22,6 +22,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 from settings_enhanced import *
+from settings_enhanced import load_save_file
 from player_enhanced import EnhancedPlayer
 from enemy_enhanced import EnemyManager
 from bullet_enhanced import BulletManager
@@ -72,6 +73,7 @@ class EnhancedGameManager:
         self.wave = 1
         self.game_time = 0
         self.level_time = 0
+        self.player_accumulator = 0.0
         
         # Performance tracking
         self.fps = 0
@@ -123,18 +125,16 @@ class EnhancedGameManager:
         try:
             # Load settings
             if SETTINGS_FILE.exists():
-                with open(SETTINGS_FILE, 'r') as f:
-                    settings = json.load(f)
-                    self.audio_manager.set_master_volume(settings.get('master_volume', MASTER_VOLUME))
-                    self.audio_manager.set_music_volume(settings.get('music_volume', MUSIC_VOLUME))
-                    self.audio_manager.set_sfx_volume(settings.get('sfx_volume', SFX_VOLUME))
+                settings = load_save_file(SETTINGS_FILE)
+                self.audio_manager.set_master_volume(settings.get('master_volume', MASTER_VOLUME))
+                self.audio_manager.set_music_volume(settings.get('music_volume', MUSIC_VOLUME))
+                self.audio_manager.set_sfx_volume(settings.get('sfx_volume', SFX_VOLUME))
             
             # Load progress
             if PROGRESS_FILE.exists():
-                with open(PROGRESS_FILE, 'r') as f:
-                    progress = json.load(f)
-                    self.level_manager.unlocked_levels = set(progress.get('unlocked_levels', [1]))
-                    self.high_score = progress.get('high_score', 0)
+                progress = load_save_file(PROGRESS_FILE)
+                self.level_manager.unlocked_levels = set(progress.get('unlocked_levels', [1]))
+                self.high_score = progress.get('high_score', 0)
             
             # Load leaderboard
             self.leaderboard_manager.load_leaderboard()
@@ -188,7 +188,12 @@ class EnhancedGameManager:
             # Apply screen effects
             self._apply_screen_effects()
 
-            pygame.display.flip()
+            # Static UI screens report what changed; everything else flips the whole frame
+            dirty_rects = self.ui_manager.take_dirty_rects()
+            if dirty_rects is None:
+                pygame.display.flip()
+            elif dirty_rects:
+                pygame.display.update(dirty_rects)
         
         # Save data before quitting
         self._save_game_data()
@@ -346,6 +351,7 @@ elif self.state == GameState.LEADERBOARD:
         self.previous_state = self.state
         self.state = new_state
         self.state_timer = 0
+        self.ui_manager.invalidate_static_screens()
         
         # State-specific initialization
         if new_state == GameState.PLAYING:
@@ -367,6 +373,7 @@ elif self.state == GameState.LEADERBOARD:
         self.wave = 1
         self.game_time = 0
         self.level_time = 0
+        self.player_accumulator = 0.0
         
         # Clear all managers
         self.enemy_manager.clear()
@@ -521,9 +528,10 @@ elif self.state == GameState.LEADERBOARD:
     def _handle_playing_events(self, event):
         """Handle playing state events."""
         if event.type == pygame.KEYDOWN:
+            # Pause stays on ESC only: the pause screen resumes on ESC alone
             if event.key == pygame.K_ESCAPE:
                 self.change_state(GameState.PAUSED)
-            elif event.key == pygame.K_x or event.key == pygame.K_LSHIFT:
+            elif KEY_TO_ACTION.get(event.key) == 'special_ability':
                 if self.player:
                     self.player.use_special_ability()
         
@@ -543,8 +551,14 @@ elif self.state == GameState.LEADERBOARD:
         self.game_time += dt
         self.level_time += dt
         
-        # Update player
-        self.player.update(dt)
+        # Update player: gameplay logic at a fixed rate, then visuals every frame
+        # drawn part way between the last two steps
+        self.player_accumulator = min(self.player_accumulator + dt,
+                                      PLAYER_FIXED_DT * MAX_FIXED_STEPS)
+        while self.player_accumulator >= PLAYER_FIXED_DT:
+            self.player.fixed_update(PLAYER_FIXED_DT)
+            self.player_accumulator -= PLAYER_FIXED_DT
+        self.player.render_update(dt, self.player_accumulator / PLAYER_FIXED_DT)
         
         # Update managers
         self.enemy_manager.update(dt, self.wave, self.current_difficulty, 
@@ -623,7 +637,7 @@ elif self.state == GameState.LEADERBOARD:
         for powerup in self.powerup_manager.powerups[:]:
             if self._check_collision(self.player, powerup):
                 self.player.apply_powerup(powerup.type)
-                self.powerup_manager.powerups.remove(powerup)
+                self.powerup_manager.remove_powerup(powerup)
                 self.audio_manager.play_sound('powerup')
                 
                 # Flash effect
@@ -711,8 +725,9 @@ elif self.state == GameState.LEADERBOARD:
     
     def _render_paused(self):
         """Render paused state."""
-        # Render game state with overlay
-        self._render_playing()
+        # Render game state with overlay (frozen, so only needed until the pause screen is cached)
+        if not self.ui_manager.has_static_screen('pause'):
+            self._render_playing()
         
         # Render pause overlay
         self.ui_manager.render_pause_menu()
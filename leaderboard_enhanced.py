@@ -18,6 +18,7 @@ from typing import Dict, List, Optional
 from datetime import datetime
 
 from settings_enhanced import *
+from settings_enhanced import load_save_file
 
 class LeaderboardManager:
     """
@@ -110,9 +111,8 @@ class LeaderboardManager:
         """
         try:
             if LEADERBOARD_FILE.exists():
-                with open(LEADERBOARD_FILE, 'r') as f:
-                    data = json.load(f)
-                    
+                data = load_save_file(LEADERBOARD_FILE)
+
                 # Validate and clean data
                 self.leaderboard_data = self._validate_leaderboard_data(data)
                 
@@ -17,6 +17,7 @@ from typing import Dict, List, Set, Tuple
 from pathlib import Path
 
 from settings_enhanced import *
+from settings_enhanced import load_save_file
 
 class LevelManager:
     """
@@ -339,8 +340,7 @@ class LevelManager:
             if not PROGRESS_FILE.exists():
                 return False
             
-            with open(PROGRESS_FILE, 'r') as f:
-                progress_data = json.load(f)
+            progress_data = load_save_file(PROGRESS_FILE)
             
             # Load unlocked levels
             unlocked_list = progress_data.get('unlocked_levels', [1])
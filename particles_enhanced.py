@@ -14,11 +14,62 @@ Professional particle system with:
 import pygame
 import math
 import random
+from collections import Counter
 from typing import List, Tuple, Dict, Optional
 from enum import Enum
 
 from settings_enhanced import *
 
+try:
+    import numpy as np
+except ImportError:
+    np = None  # NumPy is optional; emitters fall back to pure Python
+
+# Batches smaller than this are drawn with random: NumPy's per-call overhead
+# outweighs its per-sample speed for the 2-12 particle emitters
+_NUMPY_BATCH_MIN = 16
+
+# Lifetime used for particles that never fade
+_INFINITE = float('inf')
+
+# Full-alpha particle sprites keyed by (type, size, color, shape)
+_sprite_cache: Dict[tuple, pygame.Surface] = {}
+
+# Debris polygons (unit radius) and their per-size point lists, built once
+_debris_shapes: List[List[Tuple[float, float]]] = []
+_debris_points: Dict[Tuple[int, int], List[Tuple[float, float]]] = {}
+
+def _create_debris_shapes():
+    """Generate the shared pool of random debris polygons."""
+    _debris_shapes.clear()
+    _debris_points.clear()
+    
+    for _ in range(DEBRIS_SHAPE_COUNT):
+        num_points = random.randint(3, 6)
+        shape = []
+        for i in range(num_points):
+            angle = (i / num_points) * 2 * math.pi
+            radius = random.uniform(0.5, 1.0)
+            shape.append((math.cos(angle) * radius, math.sin(angle) * radius))
+        _debris_shapes.append(shape)
+    
+    # Pre-scale for the sizes debris is spawned at
+    for shape_id in range(DEBRIS_SHAPE_COUNT):
+        for size in range(1, 7):
+            _get_debris_points(shape_id, size)
+
+def _get_debris_points(shape_id: int, size: int) -> List[Tuple[float, float]]:
+    """Get a debris polygon scaled to a render size."""
+    key = (shape_id, size)
+    points = _debris_points.get(key)
+    if points is None:
+        if not _debris_shapes:
+            _create_debris_shapes()
+        points = [(size + dx * size, size + dy * size)
+                  for dx, dy in _debris_shapes[shape_id]]
+        _debris_points[key] = points
+    return points
+
 class ParticleType(Enum):
     """Particle type enumeration."""
     EXPLOSION = "explosion"
@@ -32,11 +83,23 @@ class ParticleType(Enum):
 class Particle:
     """Enhanced particle class with various effects."""
     
+    __slots__ = ('x', 'y', 'type', 'vel_x', 'vel_y', 'color', 'size',
+                 'max_lifetime', 'lifetime', 'alpha', 'gravity', 'friction',
+                 'bounce', 'rotation', 'rotation_speed', 'scale', 'fade_rate',
+                 'debris_shape_id')
+    
     def __init__(self, x: float, y: float, particle_type: ParticleType, 
                  velocity: Tuple[float, float] = (0, 0), 
                  color: Tuple[int, int, int] = WHITE,
                  size: float = 2.0, lifetime: float = 1.0):
         """Initialize a particle."""
+        self.reinit(x, y, particle_type, velocity, color, size, lifetime)
+    
+    def reinit(self, x: float, y: float, particle_type: ParticleType,
+               velocity: Tuple[float, float] = (0, 0),
+               color: Tuple[int, int, int] = WHITE,
+               size: float = 2.0, lifetime: float = 1.0):
+        """Reset every attribute so a pooled particle can be reused."""
         self.x = x
         self.y = y
         self.type = particle_type
@@ -67,7 +130,6 @@ class Particle:
             self.gravity = 50
             self.friction = 0.95
             self.fade_rate = 2.0
-            self.rotation_speed = random.uniform(-180, 180)
         
         elif self.type == ParticleType.TRAIL:
             self.friction = 0.98
@@ -89,6 +151,7 @@ class Particle:
             self.friction = 0.97
             self.rotation_speed = random.uniform(-90, 90)
             self.bounce = 0.2
+            self.debris_shape_id = random.randint(0, DEBRIS_SHAPE_COUNT - 1)
         
         elif self.type == ParticleType.SMOKE:
             self.vel_y -= 20  # Rise upward
@@ -99,10 +162,12 @@ class Particle:
         elif self.type == ParticleType.ENERGY:
             self.friction = 0.99
             self.fade_rate = 2.0
-            self.rotation_speed = random.uniform(-360, 360)
     
-    def update(self, dt: float):
-        """Update particle state."""
+    def update(self, dt: float, dt60: Optional[float] = None):
+        """Update particle state (dt60 is dt * 60, precomputed by the manager)."""
+        if dt60 is None:
+            dt60 = dt * 60
+        
         # Update lifetime
         self.lifetime -= dt * self.fade_rate
         
@@ -112,8 +177,8 @@ class Particle:
         self.vel_y *= self.friction
         
         # Update position
-        self.x += self.vel_x * dt * 60
-        self.y += self.vel_y * dt * 60
+        self.x += self.vel_x * dt60
+        self.y += self.vel_y * dt60
         
         # Handle bouncing
         if self.bounce > 0:
@@ -123,13 +188,19 @@ class Particle:
         
         # Update visual properties
         self.rotation += self.rotation_speed * dt
-        self.alpha = int(255 * max(0, self.lifetime / self.max_lifetime))
         
-        # Scale changes for some particle types
-        if self.type == ParticleType.EXPLOSION:
-            self.scale = 1.0 + (1.0 - self.lifetime / self.max_lifetime) * 0.5
-        elif self.type == ParticleType.SMOKE:
-            self.scale += dt * 0.5  # Grow over time
+        # Persistent particles keep the full alpha set at init (inf/inf is NaN)
+        if self.max_lifetime != _INFINITE:
+            life_ratio = self.lifetime / self.max_lifetime
+            self.alpha = int(255 * max(0, life_ratio))
+            
+            # Explosions expand as they fade
+            if self.type == ParticleType.EXPLOSION:
+                self.scale = 1.0 + (1.0 - life_ratio) * 0.5
+        
+        # Smoke grows over time
+        if self.type == ParticleType.SMOKE:
+            self.scale += dt * 0.5
     
     def is_alive(self) -> bool:
         """Check if particle is still alive."""
@@ -142,9 +213,36 @@ class Particle:
         if self.alpha <= 0:
             return
         
-        # Calculate render properties
+        # Skip particles that have left the screen before building a surface
         render_size = max(1, int(self.size * self.scale))
-        render_color = (*self.color, self.alpha)
+        if (self.x + render_size < 0 or self.x - render_size > SCREEN_WIDTH or
+                self.y + render_size < 0 or self.y - render_size > SCREEN_HEIGHT):
+            return
+        
+        # Sprites are cached at full alpha; fading is applied per blit
+        shape_id = self.debris_shape_id if self.type == ParticleType.DEBRIS else 0
+        key = (self.type, render_size, self.color, shape_id)
+        particle_surface = _sprite_cache.get(key)
+        if particle_surface is None:
+            particle_surface = self._build_sprite(render_size)
+            if len(_sprite_cache) >= SPRITE_CACHE_LIMIT:
+                _sprite_cache.clear()
+            _sprite_cache[key] = particle_surface
+        
+        # Apply rotation (circular sprites look the same at any angle)
+        if self.type in (ParticleType.STAR, ParticleType.DEBRIS) and abs(self.rotation) > 0.01:
+            particle_surface = pygame.transform.rotate(particle_surface, self.rotation)
+        
+        # Surface alpha
+        particle_surface.set_alpha(self.alpha)
+        
+        # Blit to screen
+        rect = particle_surface.get_rect(center=(int(self.x), int(self.y)))
+        screen.blit(particle_surface, rect)
+    
+    def _build_sprite(self, render_size: int) -> pygame.Surface:
+        """Draw this particle's shape at full alpha for the sprite cache."""
+        render_color = (*self.color, 255)
         
         # Create particle surface
         particle_surface = pygame.Surface((render_size * 2, render_size * 2), pygame.SRCALPHA)
@@ -161,13 +259,11 @@ class Particle:
             pygame.draw.circle(particle_surface, render_color, 
                              (render_size, render_size), render_size)
         
-        # Apply rotation
-        if abs(self.rotation) > 0.01:
-            particle_surface = pygame.transform.rotate(particle_surface, self.rotation)
+        # Match the display format once so blits take the fast path
+        if pygame.display.get_surface() is not None:
+            particle_surface = particle_surface.convert_alpha()
         
-        # Blit to screen
-        rect = particle_surface.get_rect(center=(int(self.x), int(self.y)))
-        screen.blit(particle_surface, rect)
+        return particle_surface
     
     def _render_star(self, surface: pygame.Surface, size: int, color: Tuple[int, int, int, int]):
         """Render star-shaped particle."""
@@ -189,18 +285,8 @@ class Particle:
     
     def _render_debris(self, surface: pygame.Surface, size: int, color: Tuple[int, int, int, int]):
         """Render debris-shaped particle."""
-        # Random polygon
-        center = size
-        points = []
-        num_points = random.randint(3, 6)
-
-        for i in range(num_points):
-            angle = (i / num_points) * 2 * math.pi
-            radius = random.uniform(size * 0.5, size)
-            x = center + math.cos(angle) * radius
-            y = center + math.sin(angle) * radius
-            points.append((x, y))
-        
+        # Shape was picked at creation so it stays stable between frames
+        points = _get_debris_points(self.debris_shape_id, size)
         pygame.draw.polygon(surface, color, points)
     
     def _render_energy(self, surface: pygame.Surface, size: int, color: Tuple[int, int, int, int]):
@@ -215,6 +301,32 @@ class Particle:
             if radius > 0:
                 pygame.draw.circle(surface, energy_color, (center, center), radius)
 
+class _Star:
+    """Minimal background star; stars never fade so they skip the Particle path."""
+    __slots__ = ('x', 'y', 'vy', 'size', 'color')
+    
+    def __init__(self, x: float, y: float, vy: float, size: int, color: Tuple[int, int, int]):
+        self.x = x
+        self.y = y
+        self.vy = vy
+        self.size = size
+        self.color = color
+
+# Star outline offsets per render size
+_star_offsets: Dict[int, List[Tuple[float, float]]] = {}
+
+def _get_star_offsets(size: int) -> List[Tuple[float, float]]:
+    """Get the eight-point star outline for a render size."""
+    offsets = _star_offsets.get(size)
+    if offsets is None:
+        offsets = []
+        for i in range(8):
+            angle = i * math.pi / 4
+            radius = size if i % 2 == 0 else size // 2
+            offsets.append((math.cos(angle) * radius, math.sin(angle) * radius))
+        _star_offsets[size] = offsets
+    return offsets
+
 class ParticleManager:
     """Enhanced particle manager for all visual effects."""
     
@@ -224,8 +336,17 @@ class ParticleManager:
         self.background_stars = []
         self.max_particles = MAX_PARTICLES
         
-        # Performance tracking
-        self.particle_count_by_type = {}
+        # Batched random numbers for the emitters
+        self._rng = np.random.default_rng() if np is not None else None
+        
+        # Pool of spare Particle instances to avoid allocation churn
+        self._free: List[Particle] = []
+        if PARTICLE_POOL_ENABLED:
+            self._free = [Particle.__new__(Particle) for _ in range(self.max_particles)]
+        
+        # Shared debris shapes
+        if not _debris_shapes:
+            _create_debris_shapes()
         
         # Initialize background
         self._create_background_stars()
@@ -235,261 +356,292 @@ class ParticleManager:
     def _create_background_stars(self):
         """Create background star field."""
         for _ in range(STAR_COUNT):
-            star = Particle(
+            star = _Star(
                 random.randint(0, SCREEN_WIDTH),
                 random.randint(0, SCREEN_HEIGHT),
-                ParticleType.STAR,
-                velocity=(0, random.uniform(10, 50)),
-                color=(random.randint(150, 255), random.randint(150, 255), random.randint(150, 255)),
-                size=random.uniform(1, 3),
-                lifetime=float('inf')  # Stars don't fade
+                random.uniform(10, 50),
+                max(1, int(random.uniform(1, 3))),
+                (random.randint(150, 255), random.randint(150, 255), random.randint(150, 255))
             )
             self.background_stars.append(star)
     
+    def _update_stars(self, dt: float):
+        """Scroll background stars and wrap them around the screen."""
+        step = dt * 60
+        for star in self.background_stars:
+            star.y += star.vy * step
+            
+            # Wrap stars around screen
+            if star.y > SCREEN_HEIGHT + 10:
+                star.y = -10
+                star.x = random.randint(0, SCREEN_WIDTH)
+    
+    def _uniform(self, low: float, high: float, count: int) -> List[float]:
+        """Draw a batch of uniform samples (one NumPy call for large batches)."""
+        if self._rng is not None and count >= _NUMPY_BATCH_MIN:
+            return self._rng.uniform(low, high, count).tolist()
+        return [random.uniform(low, high) for _ in range(count)]
+    
+    def _velocities(self, count: int, min_speed: float, max_speed: float,
+                    min_angle: float = 0.0, max_angle: float = 2 * math.pi
+                    ) -> Tuple[List[float], List[float]]:
+        """Draw a batch of random velocity vectors within an angle range."""
+        if self._rng is not None and count >= _NUMPY_BATCH_MIN:
+            angles = self._rng.uniform(min_angle, max_angle, count)
+            speeds = self._rng.uniform(min_speed, max_speed, count)
+            return (np.cos(angles) * speeds).tolist(), (np.sin(angles) * speeds).tolist()
+        
+        vel_x = []
+        vel_y = []
+        for _ in range(count):
+            angle = random.uniform(min_angle, max_angle)
+            speed = random.uniform(min_speed, max_speed)
+            vel_x.append(math.cos(angle) * speed)
+            vel_y.append(math.sin(angle) * speed)
+        return vel_x, vel_y
+    
+    def _choices(self, options: List[Tuple[int, int, int]], count: int) -> List[Tuple[int, int, int]]:
+        """Pick a batch of random entries from a small option list."""
+        if self._rng is not None and count >= _NUMPY_BATCH_MIN:
+            return [options[i] for i in self._rng.integers(0, len(options), count).tolist()]
+        return [random.choice(options) for _ in range(count)]
+    
+    def _jittered_colors(self, color: Tuple[int, int, int], spread: int,
+                         count: int) -> List[Tuple[int, int, int]]:
+        """Vary a base color per particle, clamped to the valid range."""
+        if self._rng is not None and count >= _NUMPY_BATCH_MIN:
+            jitter = self._rng.integers(-spread, spread + 1, (count, 3))
+            colors = np.clip(np.array(color) + jitter, 0, 255).tolist()
+            return [tuple(c) for c in colors]
+        
+        colors = []
+        for _ in range(count):
+            particle_color = tuple(c + random.randint(-spread, spread) for c in color)
+            colors.append(tuple(max(0, min(255, c)) for c in particle_color))
+        return colors
+    
     def create_explosion(self, x: float, y: float, particle_count: int = 20, 
                         color: Tuple[int, int, int] = (255, 200, 100)):
         """Create an explosion effect."""
-        for _ in range(particle_count):
-            # Random velocity in all directions
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(50, 200)
-            vel_x = math.cos(angle) * speed
-            vel_y = math.sin(angle) * speed
-            
-            # Vary particle properties
-            particle_color = (
-                color[0] + random.randint(-50, 50),
-                color[1] + random.randint(-50, 50),
-                color[2] + random.randint(-50, 50)
-            )
-            particle_color = tuple(max(0, min(255, c)) for c in particle_color)
-            
-            particle = Particle(
-                x + random.uniform(-5, 5),
-                y + random.uniform(-5, 5),
+        # Random velocity in all directions
+        vel_x, vel_y = self._velocities(particle_count, 50, 200)
+        offset_x = self._uniform(-5, 5, particle_count)
+        offset_y = self._uniform(-5, 5, particle_count)
+        
+        # Vary particle properties
+        colors = self._jittered_colors(color, 50, particle_count)
+        sizes = self._uniform(2, 6, particle_count)
+        lifetimes = self._uniform(0.5, 1.5, particle_count)
+        
+        for i in range(particle_count):
+            self._spawn(
+                x + offset_x[i],
+                y + offset_y[i],
                 ParticleType.EXPLOSION,
-                velocity=(vel_x, vel_y),
-                color=particle_color,
-                size=random.uniform(2, 6),
-                lifetime=random.uniform(0.5, 1.5)
+                velocity=(vel_x[i], vel_y[i]),
+                color=colors[i],
+                size=sizes[i],
+                lifetime=lifetimes[i]
             )
-            
-            self.add_particle(particle)
     
     def create_trail(self, x: float, y: float, velocity: Tuple[float, float],
                     color: Tuple[int, int, int] = UI_PRIMARY, count: int = 3):
         """Create a trail effect."""
+        offset_x = self._uniform(-2, 2, count)
+        offset_y = self._uniform(-2, 2, count)
+        
+        # Trail particles move opposite to the object
+        jitter_x = self._uniform(-20, 20, count)
+        jitter_y = self._uniform(-20, 20, count)
+        sizes = self._uniform(1, 3, count)
+        lifetimes = self._uniform(0.3, 0.8, count)
+        
         for i in range(count):
-            offset_x = random.uniform(-2, 2)
-            offset_y = random.uniform(-2, 2)
-            
-            # Trail particles move opposite to the object
-            trail_vel_x = -velocity[0] * 0.3 + random.uniform(-20, 20)
-            trail_vel_y = -velocity[1] * 0.3 + random.uniform(-20, 20)
-            
-            particle = Particle(
-                x + offset_x,
-                y + offset_y,
+            self._spawn(
+                x + offset_x[i],
+                y + offset_y[i],
                 ParticleType.TRAIL,
-                velocity=(trail_vel_x, trail_vel_y),
+                velocity=(-velocity[0] * 0.3 + jitter_x[i], -velocity[1] * 0.3 + jitter_y[i]),
                 color=color,
-                size=random.uniform(1, 3),
-                lifetime=random.uniform(0.3, 0.8)
+                size=sizes[i],
+                lifetime=lifetimes[i]
             )
-            
-            self.add_particle(particle)
     
     def create_sparks(self, x: float, y: float, count: int = 10,
                      color: Tuple[int, int, int] = (255, 255, 100)):
         """Create spark effects."""
-        for _ in range(count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(30, 100)
-            vel_x = math.cos(angle) * speed
-            vel_y = math.sin(angle) * speed
-            
-            particle = Particle(
+        vel_x, vel_y = self._velocities(count, 30, 100)
+        sizes = self._uniform(1, 2, count)
+        lifetimes = self._uniform(0.2, 0.6, count)
+        
+        for i in range(count):
+            self._spawn(
                 x,
                 y,
                 ParticleType.SPARK,
-                velocity=(vel_x, vel_y),
+                velocity=(vel_x[i], vel_y[i]),
                 color=color,
-                size=random.uniform(1, 2),
-                lifetime=random.uniform(0.2, 0.6)
+                size=sizes[i],
+                lifetime=lifetimes[i]
             )
-            
-            self.add_particle(particle)
     
     def create_debris(self, x: float, y: float, count: int = 8,
                      color: Tuple[int, int, int] = (150, 150, 150)):
         """Create debris effects."""
-        for _ in range(count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(20, 80)
-            vel_x = math.cos(angle) * speed
-            vel_y = math.sin(angle) * speed
-            
-            particle = Particle(
+        vel_x, vel_y = self._velocities(count, 20, 80)
+        sizes = self._uniform(2, 5, count)
+        lifetimes = self._uniform(1.0, 3.0, count)
+        
+        for i in range(count):
+            self._spawn(
                 x,
                 y,
                 ParticleType.DEBRIS,
-                velocity=(vel_x, vel_y),
+                velocity=(vel_x[i], vel_y[i]),
                 color=color,
-                size=random.uniform(2, 5),
-                lifetime=random.uniform(1.0, 3.0)
+                size=sizes[i],
+                lifetime=lifetimes[i]
             )
-            
-            self.add_particle(particle)
     
     def create_energy_burst(self, x: float, y: float, count: int = 15,
                            color: Tuple[int, int, int] = (100, 200, 255)):
         """Create energy burst effect."""
-        for _ in range(count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(40, 120)
-            vel_x = math.cos(angle) * speed
-            vel_y = math.sin(angle) * speed
-            
-            particle = Particle(
+        vel_x, vel_y = self._velocities(count, 40, 120)
+        sizes = self._uniform(3, 8, count)
+        lifetimes = self._uniform(0.8, 1.5, count)
+        
+        for i in range(count):
+            self._spawn(
                 x,
                 y,
                 ParticleType.ENERGY,
-                velocity=(vel_x, vel_y),
+                velocity=(vel_x[i], vel_y[i]),
                 color=color,
-                size=random.uniform(3, 8),
-                lifetime=random.uniform(0.8, 1.5)
+                size=sizes[i],
+                lifetime=lifetimes[i]
             )
-            
-            self.add_particle(particle)
     
     def create_smoke_trail(self, x: float, y: float, count: int = 5,
                           color: Tuple[int, int, int] = (128, 128, 128)):
         """Create smoke trail effect."""
-        for _ in range(count):
-            vel_x = random.uniform(-10, 10)
-            vel_y = random.uniform(-30, -10)  # Upward movement
-            
-            particle = Particle(
-                x + random.uniform(-5, 5),
-                y + random.uniform(-5, 5),
+        vel_x = self._uniform(-10, 10, count)
+        vel_y = self._uniform(-30, -10, count)  # Upward movement
+        offset_x = self._uniform(-5, 5, count)
+        offset_y = self._uniform(-5, 5, count)
+        sizes = self._uniform(3, 8, count)
+        lifetimes = self._uniform(2.0, 4.0, count)
+        
+        for i in range(count):
+            self._spawn(
+                x + offset_x[i],
+                y + offset_y[i],
                 ParticleType.SMOKE,
-                velocity=(vel_x, vel_y),
+                velocity=(vel_x[i], vel_y[i]),
                 color=color,
-                size=random.uniform(3, 8),
-                lifetime=random.uniform(2.0, 4.0)
+                size=sizes[i],
+                lifetime=lifetimes[i]
             )
-            
-            self.add_particle(particle)
     
     def create_warp_effect(self, x: float, y: float, count: int = 30):
         """Create warp/teleport effect."""
-        for _ in range(count):
-            # Create expanding ring pattern
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(80, 150)
-            vel_x = math.cos(angle) * speed
-            vel_y = math.sin(angle) * speed
-            
-            # Bright energy colors
-            colors = [(0, 255, 255), (255, 0, 255), (255, 255, 0)]
-            color = random.choice(colors)
-            
-            particle = Particle(
+        # Create expanding ring pattern
+        vel_x, vel_y = self._velocities(count, 80, 150)
+        
+        # Bright energy colors
+        colors = self._choices([(0, 255, 255), (255, 0, 255), (255, 255, 0)], count)
+        sizes = self._uniform(2, 6, count)
+        lifetimes = self._uniform(0.5, 1.0, count)
+        
+        for i in range(count):
+            self._spawn(
                 x,
                 y,
                 ParticleType.ENERGY,
-                velocity=(vel_x, vel_y),
-                color=color,
-                size=random.uniform(2, 6),
-                lifetime=random.uniform(0.5, 1.0)
+                velocity=(vel_x[i], vel_y[i]),
+                color=colors[i],
+                size=sizes[i],
+                lifetime=lifetimes[i]
             )
-            
-            self.add_particle(particle)
     
     def create_shield_impact(self, x: float, y: float, count: int = 15):
         """Create shield impact effect."""
-        for _ in range(count):
-            # Particles spread outward from impact point
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(30, 80)
-            vel_x = math.cos(angle) * speed
-            vel_y = math.sin(angle) * speed
-            
-            particle = Particle(
-                x + random.uniform(-10, 10),
-                y + random.uniform(-10, 10),
+        # Particles spread outward from impact point
+        vel_x, vel_y = self._velocities(count, 30, 80)
+        offset_x = self._uniform(-10, 10, count)
+        offset_y = self._uniform(-10, 10, count)
+        sizes = self._uniform(1, 4, count)
+        lifetimes = self._uniform(0.3, 0.8, count)
+        
+        for i in range(count):
+            self._spawn(
+                x + offset_x[i],
+                y + offset_y[i],
                 ParticleType.SPARK,
-                velocity=(vel_x, vel_y),
+                velocity=(vel_x[i], vel_y[i]),
                 color=POWERUP_SHIELD,
-                size=random.uniform(1, 4),
-                lifetime=random.uniform(0.3, 0.8)
+                size=sizes[i],
+                lifetime=lifetimes[i]
             )
-            
-            self.add_particle(particle)
     
     def create_power_up_aura(self, x: float, y: float, powerup_color: Tuple[int, int, int]):
         """Create continuous aura effect around power-ups."""
-        for _ in range(3):
-            # Gentle floating particles
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(10, 30)
-            vel_x = math.cos(angle) * speed
-            vel_y = math.sin(angle) * speed - 20  # Slight upward drift
-            
-            particle = Particle(
-                x + random.uniform(-15, 15),
-                y + random.uniform(-15, 15),
+        # Gentle floating particles
+        vel_x, vel_y = self._velocities(3, 10, 30)
+        offset_x = self._uniform(-15, 15, 3)
+        offset_y = self._uniform(-15, 15, 3)
+        sizes = self._uniform(1, 3, 3)
+        lifetimes = self._uniform(1.0, 2.0, 3)
+        
+        for i in range(3):
+            self._spawn(
+                x + offset_x[i],
+                y + offset_y[i],
                 ParticleType.ENERGY,
-                velocity=(vel_x, vel_y),
+                velocity=(vel_x[i], vel_y[i] - 20),  # Slight upward drift
                 color=powerup_color,
-                size=random.uniform(1, 3),
-                lifetime=random.uniform(1.0, 2.0)
+                size=sizes[i],
+                lifetime=lifetimes[i]
             )
-            
-            self.add_particle(particle)
     
     def create_engine_exhaust(self, x: float, y: float, velocity: Tuple[float, float]):
         """Create engine exhaust trail."""
-        for _ in range(2):
-            # Exhaust particles move opposite to ship direction
-            exhaust_vel_x = -velocity[0] * 0.5 + random.uniform(-20, 20)
-            exhaust_vel_y = -velocity[1] * 0.5 + random.uniform(20, 60)
-            
-            # Engine colors (blue to white)
-            colors = [(100, 150, 255), (150, 200, 255), (200, 220, 255)]
-            color = random.choice(colors)
-            
-            particle = Particle(
-                x + random.uniform(-3, 3),
+        # Exhaust particles move opposite to ship direction
+        jitter_x = self._uniform(-20, 20, 2)
+        jitter_y = self._uniform(20, 60, 2)
+        
+        # Engine colors (blue to white)
+        colors = self._choices([(100, 150, 255), (150, 200, 255), (200, 220, 255)], 2)
+        offset_x = self._uniform(-3, 3, 2)
+        sizes = self._uniform(1, 3, 2)
+        lifetimes = self._uniform(0.2, 0.5, 2)
+        
+        for i in range(2):
+            self._spawn(
+                x + offset_x[i],
                 y + 15,  # Behind the ship
                 ParticleType.TRAIL,
-                velocity=(exhaust_vel_x, exhaust_vel_y),
-                color=color,
-                size=random.uniform(1, 3),
-                lifetime=random.uniform(0.2, 0.5)
+                velocity=(-velocity[0] * 0.5 + jitter_x[i], -velocity[1] * 0.5 + jitter_y[i]),
+                color=colors[i],
+                size=sizes[i],
+                lifetime=lifetimes[i]
             )
-            
-            self.add_particle(particle)
     
     def create_bullet_impact(self, x: float, y: float, bullet_color: Tuple[int, int, int]):
         """Create bullet impact effect."""
-        for _ in range(8):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(20, 60)
-            vel_x = math.cos(angle) * speed
-            vel_y = math.sin(angle) * speed
-            
-            particle = Particle(
+        vel_x, vel_y = self._velocities(8, 20, 60)
+        sizes = self._uniform(1, 2, 8)
+        lifetimes = self._uniform(0.1, 0.4, 8)
+        
+        for i in range(8):
+            self._spawn(
                 x,
                 y,
                 ParticleType.SPARK,
-                velocity=(vel_x, vel_y),
+                velocity=(vel_x[i], vel_y[i]),
                 color=bullet_color,
-                size=random.uniform(1, 2),
-                lifetime=random.uniform(0.1, 0.4)
+                size=sizes[i],
+                lifetime=lifetimes[i]
             )
-            
-            self.add_particle(particle)
     
     def create_level_transition(self, center_x: float, center_y: float):
         """Create level transition effect."""
@@ -497,76 +649,93 @@ class ParticleManager:
         for radius in range(0, 300, 15):
             particle_count = max(8, radius // 10)
             
-            for i in range(particle_count):
-                angle = (i / particle_count) * 2 * math.pi
-                x = center_x + math.cos(angle) * radius
-                y = center_y + math.sin(angle) * radius
-                
-                # Skip if outside screen
-                if x < 0 or x > SCREEN_WIDTH or y < 0 or y > SCREEN_HEIGHT:
-                    continue
-                
-                # Gradient colors from center
-                distance_factor = radius / 300.0
-                color = (
-                    int(255 * (1 - distance_factor)),
-                    int(255 * distance_factor),
-                    255
-                )
-                
-                particle = Particle(
+            # Gradient colors from center (constant per ring)
+            distance_factor = radius / 300.0
+            color = (
+                int(255 * (1 - distance_factor)),
+                int(255 * distance_factor),
+                255
+            )
+            lifetime = 1.0 - distance_factor * 0.5
+            
+            # Only on-screen points are emitted
+            for x, y in self._ring_points(center_x, center_y, radius, particle_count):
+                self._spawn(
                     x, y,
                     ParticleType.ENERGY,
                     velocity=(0, 0),
                     color=color,
                     size=3,
-                    lifetime=1.0 - distance_factor * 0.5
+                    lifetime=lifetime
                 )
-                
-                self.add_particle(particle)
+    
+    def _ring_points(self, center_x: float, center_y: float, radius: float,
+                     count: int) -> List[Tuple[float, float]]:
+        """Get evenly spaced ring points, culled to the screen before emission."""
+        if np is not None and count >= _NUMPY_BATCH_MIN:
+            theta = np.linspace(0, 2 * np.pi, count, endpoint=False)
+            px = center_x + np.cos(theta) * radius
+            py = center_y + np.sin(theta) * radius
+            mask = (px >= 0) & (px <= SCREEN_WIDTH) & (py >= 0) & (py <= SCREEN_HEIGHT)
+            return list(zip(px[mask].tolist(), py[mask].tolist()))
+        
+        points = []
+        for i in range(count):
+            angle = (i / count) * 2 * math.pi
+            x = center_x + math.cos(angle) * radius
+            y = center_y + math.sin(angle) * radius
+            if 0 <= x <= SCREEN_WIDTH and 0 <= y <= SCREEN_HEIGHT:
+                points.append((x, y))
+        return points
     
     def add_particle(self, particle: Particle):
         """Add a particle to the system."""
         if len(self.particles) >= self.max_particles:
             # Remove oldest particle
-            self.particles.pop(0)
+            self._release(self.particles.pop(0))
         
         self.particles.append(particle)
+    
+    def _spawn(self, x: float, y: float, particle_type: ParticleType,
+               velocity: Tuple[float, float] = (0, 0),
+               color: Tuple[int, int, int] = WHITE,
+               size: float = 2.0, lifetime: float = 1.0) -> Particle:
+        """Create a particle, reusing a pooled instance when one is free."""
+        if self._free:
+            particle = self._free.pop()
+            particle.reinit(x, y, particle_type, velocity, color, size, lifetime)
+        else:
+            particle = Particle(x, y, particle_type, velocity, color, size, lifetime)
         
-        # Update count tracking
-        particle_type = particle.type.value
-        self.particle_count_by_type[particle_type] = \
-            self.particle_count_by_type.get(particle_type, 0) + 1
+        self.add_particle(particle)
+        return particle
+    
+    def _release(self, particle: Particle):
+        """Return a dead particle to the pool."""
+        if PARTICLE_POOL_ENABLED and len(self._free) < self.max_particles:
+            self._free.append(particle)
     
     def update(self, dt: float):
         """Update all particles."""
         # Update background stars
-        for star in self.background_stars[:]:
-            star.update(dt)
-            
-            # Wrap stars around screen
-            if star.y > SCREEN_HEIGHT + 10:
-                star.y = -10
-                star.x = random.randint(0, SCREEN_WIDTH)
+        self._update_stars(dt)
         
         # Update particles
+        dt60 = dt * 60
         for particle in self.particles[:]:
-            particle.update(dt)
+            particle.update(dt, dt60)
             
             if not particle.is_alive():
                 self.particles.remove(particle)
-                
-                # Update count tracking
-                particle_type = particle.type.value
-                if particle_type in self.particle_count_by_type:
-                    self.particle_count_by_type[particle_type] -= 1
-                    if self.particle_count_by_type[particle_type] <= 0:
-                        del self.particle_count_by_type[particle_type]
+                self._release(particle)
     
     def render_background(self, screen: pygame.Surface):
         """Render background particles (stars)."""
         for star in self.background_stars:
-            star.render(screen)
+            x = star.x
+            y = star.y
+            points = [(x + dx, y + dy) for dx, dy in _get_star_offsets(star.size)]
+            pygame.draw.polygon(screen, star.color, points)
     
     def render_foreground(self, screen: pygame.Surface):
         """Render foreground particles (effects)."""
@@ -575,8 +744,9 @@ class ParticleManager:
     
     def clear(self):
         """Clear all particles except background."""
+        for particle in self.particles:
+            self._release(particle)
         self.particles.clear()
-        self.particle_count_by_type.clear()
     
     def clear_game_particles(self):
         """Clear only game-related particles, keep background."""
@@ -584,9 +754,8 @@ class ParticleManager:
     
     def clear_all(self):
         """Clear all particles including background."""
-        self.particles.clear()
+        self.clear()
         self.background_stars.clear()
-        self.particle_count_by_type.clear()
         self._create_background_stars()
     
     def get_particle_count(self) -> int:
@@ -595,7 +764,8 @@ class ParticleManager:
     
     def get_particle_statistics(self) -> Dict[str, int]:
         """Get particle statistics by type."""
-        stats = self.particle_count_by_type.copy()
+        # Counted on demand; only the UI asks for this, and rarely
+        stats = dict(Counter(particle.type.value for particle in self.particles))
         stats['background_stars'] = len(self.background_stars)
         stats['total'] = self.get_particle_count()
         return stats
@@ -606,7 +776,7 @@ class ParticleManager:
         
         # Remove excess particles if needed
         while len(self.particles) > self.max_particles:
-            self.particles.pop(0)
+            self._release(self.particles.pop(0))
     
     def create_screen_clear_effect(self, center_x: float, center_y: float):
         """Create a screen-clearing wave effect."""
@@ -615,16 +785,8 @@ class ParticleManager:
             circumference = 2 * math.pi * radius
             particle_count = max(8, int(circumference / 10))
             
-            for i in range(particle_count):
-                angle = (i / particle_count) * 2 * math.pi
-                x = center_x + math.cos(angle) * radius
-                y = center_y + math.sin(angle) * radius
-                
-                # Skip if outside screen
-                if x < 0 or x > SCREEN_WIDTH or y < 0 or y > SCREEN_HEIGHT:
-                    continue
-                
-                particle = Particle(
+            for x, y in self._ring_points(center_x, center_y, radius, particle_count):
+                self._spawn(
                     x, y,
                     ParticleType.ENERGY,
                     velocity=(0, 0),
@@ -632,110 +794,96 @@ class ParticleManager:
                     size=3,
                     lifetime=0.5
                 )
-                
-                self.add_particle(particle)
     
     def create_power_up_effect(self, x: float, y: float, 
                               color: Tuple[int, int, int] = UI_SUCCESS):
         """Create power-up collection effect."""
         # Upward burst
-        for _ in range(12):
-            angle = random.uniform(-math.pi/3, -2*math.pi/3)  # Upward cone
-            speed = random.uniform(60, 120)
-            vel_x = math.cos(angle) * speed
-            vel_y = math.sin(angle) * speed
-            
-            particle = Particle(
-                x + random.uniform(-5, 5),
-                y + random.uniform(-5, 5),
+        vel_x, vel_y = self._velocities(12, 60, 120, -2 * math.pi / 3, -math.pi / 3)  # Upward cone
+        offset_x = self._uniform(-5, 5, 12)
+        offset_y = self._uniform(-5, 5, 12)
+        sizes = self._uniform(2, 5, 12)
+        lifetimes = self._uniform(0.8, 1.2, 12)
+        
+        for i in range(12):
+            self._spawn(
+                x + offset_x[i],
+                y + offset_y[i],
                 ParticleType.ENERGY,
-                velocity=(vel_x, vel_y),
+                velocity=(vel_x[i], vel_y[i]),
                 color=color,
-                size=random.uniform(2, 5),
-                lifetime=random.uniform(0.8, 1.2)
+                size=sizes[i],
+                lifetime=lifetimes[i]
             )
-            
-            self.add_particle(particle)
     
     def create_boss_entrance(self, x: float, y: float):
         """Create dramatic boss entrance effect."""
+        # Boss colors (orange/red)
+        colors = ((255, 100, 0), (255, 150, 50), (255, 200, 100))
+        
         # Multiple explosion rings
         for ring in range(3):
             ring_radius = (ring + 1) * 50
             particle_count = 16 + ring * 8
+            sizes = self._uniform(4, 8, particle_count)
+            lifetimes = self._uniform(1.0, 2.0, particle_count)
+            color = colors[ring % len(colors)]
             
             for i in range(particle_count):
                 angle = (i / particle_count) * 2 * math.pi
                 vel_x = math.cos(angle) * ring_radius
                 vel_y = math.sin(angle) * ring_radius
                 
-                # Boss colors (orange/red)
-                colors = [(255, 100, 0), (255, 150, 50), (255, 200, 100)]
-                color = colors[ring % len(colors)]
-                
-                particle = Particle(
+                self._spawn(
                     x, y,
                     ParticleType.EXPLOSION,
                     velocity=(vel_x, vel_y),
                     color=color,
-                    size=random.uniform(4, 8),
-                    lifetime=random.uniform(1.0, 2.0)
+                    size=sizes[i],
+                    lifetime=lifetimes[i]
                 )
-                
-                self.add_particle(particle)
     
     def create_victory_celebration(self, center_x: float, center_y: float):
         """Create victory celebration effect."""
-        # Fireworks-like effect
-        for _ in range(50):
-            # Random explosion points around center
-            explosion_x = center_x + random.uniform(-200, 200)
-            explosion_y = center_y + random.uniform(-150, 150)
-            
-            # Create small explosion at each point
-            for _ in range(8):
-                angle = random.uniform(0, 2 * math.pi)
-                speed = random.uniform(30, 80)
-                vel_x = math.cos(angle) * speed
-                vel_y = math.sin(angle) * speed
-                
-                # Victory colors (gold, white, cyan)
-                colors = [(255, 215, 0), (255, 255, 255), (0, 255, 255)]
-                color = random.choice(colors)
-                
-                particle = Particle(
-                    explosion_x, explosion_y,
-                    ParticleType.SPARK,
-                    velocity=(vel_x, vel_y),
-                    color=color,
-                    size=random.uniform(2, 4),
-                    lifetime=random.uniform(1.0, 2.5)
-                )
-                
-                self.add_particle(particle)
+        # Fireworks-like effect: 50 bursts of 8 sparks, drawn in one batch
+        burst_count = 50
+        sparks_per_burst = 8
+        total = burst_count * sparks_per_burst
+        
+        # Random explosion points around center
+        burst_x = self._uniform(center_x - 200, center_x + 200, burst_count)
+        burst_y = self._uniform(center_y - 150, center_y + 150, burst_count)
+        
+        vel_x, vel_y = self._velocities(total, 30, 80)
+        
+        # Victory colors (gold, white, cyan)
+        colors = self._choices([(255, 215, 0), (255, 255, 255), (0, 255, 255)], total)
+        sizes = self._uniform(2, 4, total)
+        lifetimes = self._uniform(1.0, 2.5, total)
+        
+        for i in range(total):
+            burst = i // sparks_per_burst
+            self._spawn(
+                burst_x[burst], burst_y[burst],
+                ParticleType.SPARK,
+                velocity=(vel_x[i], vel_y[i]),
+                color=colors[i],
+                size=sizes[i],
+                lifetime=lifetimes[i]
+            )
     
     def update_with_time_scale(self, dt: float, time_scale: float = 1.0):
         """Update particles with time scaling (for slow motion effects)."""
         scaled_dt = dt * time_scale
         
         # Update background stars (not affected by time scale)
-        for star in self.background_stars[:]:
-            star.update(dt)
-            
-            if star.y > SCREEN_HEIGHT + 10:
-                star.y = -10
-                star.x = random.randint(0, SCREEN_WIDTH)
+        self._update_stars(dt)
         
         # Update particles with time scale
+        dt60 = scaled_dt * 60
         for particle in self.particles[:]:
-            particle.update(scaled_dt)
+            particle.update(scaled_dt, dt60)
             
             if not particle.is_alive():
                 self.particles.remove(particle)
-                
-                # Update count tracking
-                particle_type = particle.type.value
-                if particle_type in self.particle_count_by_type:
-                    self.particle_count_by_type[particle_type] -= 1
-                    if self.particle_count_by_type[particle_type] <= 0:
-                        del self.particle_count_by_type[particle_type]
+                self._release(particle)
@@ -13,24 +13,117 @@ Professional player implementation with:
 """
 
 import pygame
+import logging
 import math
 import time
-from typing import Dict, List, Tuple
+from array import array
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 
 from settings_enhanced import *
+from bullet_enhanced import Bullet
+
+# Gameplay events are logged at debug level rather than printed from the frame loop
+_log = logging.getLogger(__name__)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # NumPy is optional; the engine trail falls back to array.array
+
+# Maximum number of live engine trail particles
+_TRAIL_CAPACITY = 10
+
+# Trail alpha is quantized to this many levels, each with its own pre-faded dot
+_TRAIL_LEVELS = 32
+
+# Timed power-ups and their slots in the per-player timer array
+_TIMED_POWERUPS = ('shield', 'rapid_fire', 'multi_shot', 'time_slow', 'homing')
+POWERUP_INDEX = {name: i for i, name in enumerate(_TIMED_POWERUPS)}
+
+# Damage flash is quantized to this many tint levels for the ship sprite cache
+_FLASH_LEVELS = 8
+
+# Ship rotation is quantized to this many degrees; rotated sprites are kept LRU
+_ROTATION_STEP = 5
+_ROT_CACHE_LIMIT = 64
+
+# Key binding tuples resolved once at import; checked against a single keystate read
+_KB_LEFT = tuple(KEY_BINDINGS['move_left'])
+_KB_RIGHT = tuple(KEY_BINDINGS['move_right'])
+_KB_UP = tuple(KEY_BINDINGS['move_up'])
+_KB_DOWN = tuple(KEY_BINDINGS['move_down'])
+_KB_SHOOT = tuple(KEY_BINDINGS['shoot'])
+
+# Diagonal movement normalization factor
+_INV_SQRT2 = 0.7071067811865475
+
+# Multi-shot spread: horizontal offset (and manager velocity) for each bullet
+_MULTISHOT_OFFSETS = tuple(math.sin(angle) * 20 for angle in (-0.3, 0, 0.3))
+
+def _convert(surface: pygame.Surface) -> pygame.Surface:
+    """Match the display pixel format once so blits take the fast path."""
+    if pygame.display.get_surface() is not None:
+        return surface.convert_alpha()
+    return surface
+
+def _build_trail_surface(level: int) -> Optional[pygame.Surface]:
+    """Draw the engine trail dot for an alpha level (None when it has no size)."""
+    size = level * 8 // _TRAIL_LEVELS
+    if size <= 0:
+        return None
+    
+    surface = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.circle(surface, UI_PRIMARY, (size // 2, size // 2), size // 2)
+    surface = _convert(surface)
+    surface.set_alpha(level * 255 // _TRAIL_LEVELS)
+    return surface
 
 class EnhancedPlayer:
     """
     Enhanced player class with advanced mechanics, power-ups, and abilities.
     """
     
+    # Hot per-frame state first, then the rest of the per-instance attributes
+    __slots__ = ('x', 'y', 'velocity_x', 'velocity_y', 'health', 'invulnerable',
+                 '_now', 'size', 'difficulty', 'speed', 'acceleration', 'friction',
+                 'max_health', 'invulnerability_timer', 'fire_rate', 'last_shot_time',
+                 'bullet_damage', 'special_ability_cooldown', 'last_special_use',
+                 'time_freeze_active', 'time_freeze_timer', 'active_powerups',
+                 '_powerup_timers', 'sprite_angle', 'trail_count', 'trail_x', 'trail_y',
+                 'trail_alpha', 'shield_effect', 'damage_flash', '_ship_surfaces',
+                 '_rot_cache', '_shield_cache', 'keys_pressed', '_speed_mult',
+                 '_fire_interval', '_multi_shot', '_any_powerup_active', '_x_min',
+                 '_x_max', '_y_min', '_y_max', '_flash_on', '_prev_x', '_prev_y',
+                 '_blend')
+    
+    # Shared power-up indicator font and pre-rendered labels
+    _indicator_font = None
+    _indicator_labels: Dict[str, pygame.Surface] = {}
+    
+    # Shared pre-faded engine trail dots, indexed by alpha level
+    _trail_surfaces: List[Optional[pygame.Surface]] = []
+    
     def __init__(self, x: float, y: float, difficulty: str):
         """Initialize the enhanced player."""
         self.x = x
         self.y = y
+        
+        # Position before the last logic step, and how far to blend from it
+        # towards (x, y) when drawing
+        self._prev_x = x
+        self._prev_y = y
+        self._blend = 1.0
+        
         self.size = PLAYER_SIZE
         self.difficulty = difficulty
         
+        # Screen bounds for the player's center
+        self._x_min = self.size[0] // 2
+        self._x_max = SCREEN_WIDTH - self._x_min
+        self._y_min = self.size[1] // 2
+        self._y_max = SCREEN_HEIGHT - self._y_min
+        
         # Movement
         self.speed = PLAYER_SPEED
         self.velocity_x = 0
@@ -57,21 +150,56 @@ class EnhancedPlayer:
         
         # Power-ups
         self.active_powerups = {}
-        self.powerup_timers = {}
+        # Remaining time per timed power-up (see POWERUP_INDEX); inactive slots
+        # hold -inf so a single vectorized decrement never revives them
+        if np is not None:
+            self._powerup_timers = np.full(len(_TIMED_POWERUPS), -np.inf, np.float32)
+        else:
+            self._powerup_timers = [-math.inf] * len(_TIMED_POWERUPS)
         
         # Visual effects
         self.sprite_angle = 0
-        self.trail_particles = []
+        # Engine trail stored as parallel x/y/alpha buffers; only the first
+        # trail_count entries are live
+        self.trail_count = 0
+        if np is not None:
+            self.trail_x = np.zeros(_TRAIL_CAPACITY, np.float32)
+            self.trail_y = np.zeros(_TRAIL_CAPACITY, np.float32)
+            self.trail_alpha = np.zeros(_TRAIL_CAPACITY, np.float32)
+        else:
+            self.trail_x = array('f', [0.0]) * _TRAIL_CAPACITY
+            self.trail_y = array('f', [0.0]) * _TRAIL_CAPACITY
+            self.trail_alpha = array('f', [0.0]) * _TRAIL_CAPACITY
         self.shield_effect = 0
         self.damage_flash = 0
         
+        # Pre-rendered ship sprites keyed by flash level, rotated variants keyed
+        # by (angle bucket, flash level), and shield rings keyed by radius
+        self._ship_surfaces: Dict[int, pygame.Surface] = {}
+        self._rot_cache: Dict[Tuple[int, int], pygame.Surface] = OrderedDict()
+        self._shield_cache: Dict[int, pygame.Surface] = {}
+        self._get_ship_surface(0)
+        
         # Input state
         self.keys_pressed = set()
         
+        # Frame timestamp shared by everything that needs wall-clock time, and
+        # the invulnerability blink phase derived from it
+        self._now = time.time()
+        self._flash_on = False
+        
+        if EnhancedPlayer._indicator_font is None:
+            EnhancedPlayer._indicator_font = pygame.font.Font(None, 20)
+        if not EnhancedPlayer._trail_surfaces:
+            EnhancedPlayer._trail_surfaces = [_build_trail_surface(level) for level in range(_TRAIL_LEVELS + 1)]
+        
         # Apply difficulty modifiers
         self._apply_difficulty_modifiers()
         
-        print(f"Enhanced Player created - Difficulty: {difficulty}")
+        # Stats derived from the active power-up set
+        self._recompute_powerup_derived()
+        
+        _log.debug("Enhanced Player created - Difficulty: %s", difficulty)
     
     def _apply_difficulty_modifiers(self):
         """Apply difficulty-based modifiers to player stats."""
@@ -85,8 +213,53 @@ class EnhancedPlayer:
             self.max_health = int(self.max_health * 1.2)
             self.health = self.max_health
     
+    def _recompute_powerup_derived(self):
+        """Refresh cached movement/shooting modifiers after the power-up set changes."""
+        speed_mult = 1.0
+        fire_rate = self.fire_rate
+        if 'rapid_fire' in self.active_powerups:
+            speed_mult *= 1.2
+            fire_rate *= 2
+        if 'shield' in self.active_powerups:
+            speed_mult *= 0.8  # Slower when shielded
+        
+        self._speed_mult = speed_mult
+        self._fire_interval = 1.0 / fire_rate
+        self._multi_shot = 'multi_shot' in self.active_powerups
+        self._any_powerup_active = bool(self.active_powerups)
+    
     def update(self, dt: float):
-        """Update player state."""
+        """
+        Update player state with a variable timestep.
+        
+        Samples the frame timestamp once; call this before render() each frame.
+        """
+        self._sample_frame_time()
+        self.fixed_update(dt)
+        self._blend = 1.0
+        self._update_visual_effects(dt)
+    
+    def render_update(self, dt: float, blend: float):
+        """
+        Per-frame work for a fixed-timestep loop: sample the frame timestamp and
+        advance visual effects. Call once per rendered frame after the frame's
+        fixed_update() steps, with blend = leftover accumulator / step size.
+        """
+        self._blend = blend
+        self._sample_frame_time()
+        self._update_visual_effects(dt)
+    
+    def _sample_frame_time(self):
+        """Record the frame timestamp and the invulnerability blink phase."""
+        now = time.time()
+        self._now = now
+        self._flash_on = bool(int(now * 10) & 1)
+    
+    def fixed_update(self, dt: float):
+        """Advance input, movement, timers and power-ups by one logic step."""
+        self._prev_x = self.x
+        self._prev_y = self.y
+        
         # Handle input
         self._handle_input(dt)
         
@@ -99,33 +272,32 @@ class EnhancedPlayer:
         # Update power-ups
         self._update_powerups(dt)
         
-        # Update visual effects
-        self._update_visual_effects(dt)
-        
         # Keep player on screen
         self._clamp_to_screen()
     
     def _handle_input(self, dt: float):
         """Handle player input with smooth movement."""
-        keys = pygame.key.get_pressed()
+        # Read the keystate once and share it across all checks this frame
+        pressed = pygame.key.get_pressed().__getitem__
         
         # Movement input
+        speed = self.speed
         target_vel_x = 0
         target_vel_y = 0
         
-        if any(keys[key] for key in KEY_BINDINGS['move_left']):
-            target_vel_x = -self.speed
-        if any(keys[key] for key in KEY_BINDINGS['move_right']):
-            target_vel_x = self.speed
-        if any(keys[key] for key in KEY_BINDINGS['move_up']):
-            target_vel_y = -self.speed
-        if any(keys[key] for key in KEY_BINDINGS['move_down']):
-            target_vel_y = self.speed
+        if any(map(pressed, _KB_LEFT)):
+            target_vel_x = -speed
+        if any(map(pressed, _KB_RIGHT)):
+            target_vel_x = speed
+        if any(map(pressed, _KB_UP)):
+            target_vel_y = -speed
+        if any(map(pressed, _KB_DOWN)):
+            target_vel_y = speed
         
         # Diagonal movement normalization
-        if target_vel_x != 0 and target_vel_y != 0:
-            target_vel_x *= 0.707  # 1/sqrt(2)
-            target_vel_y *= 0.707
+        if target_vel_x and target_vel_y:
+            target_vel_x *= _INV_SQRT2
+            target_vel_y *= _INV_SQRT2
         
         # Smooth acceleration
         self.velocity_x += (target_vel_x - self.velocity_x) * self.acceleration
@@ -136,25 +308,19 @@ class EnhancedPlayer:
         self.velocity_y *= self.friction
         
         # Shooting
-        if any(keys[key] for key in KEY_BINDINGS['shoot']):
+        if any(map(pressed, _KB_SHOOT)):
             self.shoot()
     
     def _update_movement(self, dt: float):
         """Update player position."""
         # Apply power-up speed modifiers
-        speed_mult = 1.0
-        if 'rapid_fire' in self.active_powerups:
-            speed_mult *= 1.2
-        if 'shield' in self.active_powerups:
-            speed_mult *= 0.8  # Slower when shielded
+        speed_mult = self._speed_mult
         
         self.x += self.velocity_x * speed_mult * dt * 60  # 60 FPS normalization
         self.y += self.velocity_y * speed_mult * dt * 60
     
     def _update_timers(self, dt: float):
         """Update various timers."""
-        current_time = time.time()
-        
         # Invulnerability timer
         if self.invulnerable:
             self.invulnerability_timer -= dt
@@ -176,56 +342,112 @@ class EnhancedPlayer:
     
     def _update_powerups(self, dt: float):
         """Update active power-ups."""
-        expired_powerups = []
+        if not self._any_powerup_active:
+            return
         
-        for powerup_type, timer in self.powerup_timers.items():
-            timer -= dt
-            if timer <= 0:
-                expired_powerups.append(powerup_type)
-            else:
-                self.powerup_timers[powerup_type] = timer
+        timers = self._powerup_timers
+        
+        if np is not None:
+            was_active = timers > 0
+            timers -= dt
+            expired = np.flatnonzero(was_active & (timers <= 0)).tolist()
+        else:
+            expired = []
+            for i, timer in enumerate(timers):
+                if timer > 0:
+                    timer -= dt
+                    timers[i] = timer
+                    if timer <= 0:
+                        expired.append(i)
         
         # Remove expired power-ups
-        for powerup_type in expired_powerups:
-            if powerup_type in self.active_powerups:
-                del self.active_powerups[powerup_type]
-            if powerup_type in self.powerup_timers:
-                del self.powerup_timers[powerup_type]
+        for i in expired:
+            self.active_powerups.pop(_TIMED_POWERUPS[i], None)
+        
+        if expired:
+            self._recompute_powerup_derived()
     
-    def _update_visual_effects(self, dt: float):
+    def _update_visual_effects(self, dt: float, _atan2=math.atan2):
         """Update visual effects."""
         # Sprite rotation based on movement
         if abs(self.velocity_x) > 0.1:
-            target_angle = math.atan2(-self.velocity_x, 1) * 0.3  # Subtle banking
+            target_angle = _atan2(-self.velocity_x, 1) * 0.3  # Subtle banking
             self.sprite_angle += (target_angle - self.sprite_angle) * 0.1
         else:
             self.sprite_angle *= 0.9  # Return to center
         
         # Update trail particles
-        self.trail_particles = [(x, y, alpha - dt * 2) for x, y, alpha in self.trail_particles if alpha > 0]
+        self._update_trail(dt)
         
         # Add new trail particle
-        if len(self.trail_particles) < 10:
-            self.trail_particles.append((self.x, self.y + self.size[1] // 2, 1.0))
+        n = self.trail_count
+        if n < _TRAIL_CAPACITY:
+            self.trail_x[n] = self._render_x()
+            self.trail_y[n] = self._render_y() + self.size[1] // 2
+            self.trail_alpha[n] = 1.0
+            self.trail_count = n + 1
+    
+    def _render_x(self) -> float:
+        """X to draw at, blended between the last two logic steps."""
+        return self._prev_x + (self.x - self._prev_x) * self._blend
+    
+    def _render_y(self) -> float:
+        """Y to draw at, blended between the last two logic steps."""
+        return self._prev_y + (self.y - self._prev_y) * self._blend
+    
+    def _update_trail(self, dt: float):
+        """Fade trail particles and compact the live ones to the front."""
+        n = self.trail_count
+        if not n:
+            return
+        
+        if np is not None:
+            alpha = self.trail_alpha[:n]
+            alpha -= dt * 2
+            keep = np.flatnonzero(alpha > 0)
+            kept = len(keep)
+            if kept < n:
+                self.trail_x[:kept] = self.trail_x[keep]
+                self.trail_y[:kept] = self.trail_y[keep]
+                self.trail_alpha[:kept] = self.trail_alpha[keep]
+            self.trail_count = kept
+            return
+        
+        # In-place compaction over the float buffers; no per-particle objects
+        trail_x = self.trail_x
+        trail_y = self.trail_y
+        trail_alpha = self.trail_alpha
+        fade = dt * 2
+        kept = 0
+        for i in range(n):
+            alpha = trail_alpha[i] - fade
+            if alpha > 0:
+                trail_x[kept] = trail_x[i]
+                trail_y[kept] = trail_y[i]
+                trail_alpha[kept] = alpha
+                kept += 1
+        self.trail_count = kept
     
     def _clamp_to_screen(self):
         """Keep player within screen boundaries."""
-        half_width = self.size[0] // 2
-        half_height = self.size[1] // 2
-        
-        self.x = max(half_width, min(SCREEN_WIDTH - half_width, self.x))
-        self.y = max(half_height, min(SCREEN_HEIGHT - half_height, self.y))
+        x = self.x
+        if x < self._x_min:
+            self.x = self._x_min
+        elif x > self._x_max:
+            self.x = self._x_max
+        
+        y = self.y
+        if y < self._y_min:
+            self.y = self._y_min
+        elif y > self._y_max:
+            self.y = self._y_max
     
     def shoot(self, bullet_manager=None):
         """Shoot bullets based on current power-ups."""
-        current_time = time.time()
+        current_time = self._now
         
         # Check fire rate
-        fire_rate = self.fire_rate
-        if 'rapid_fire' in self.active_powerups:
-            fire_rate *= 2
-        
-        if current_time - self.last_shot_time < 1.0 / fire_rate:
+        if current_time - self.last_shot_time < self._fire_interval:
             return []
         
         self.last_shot_time = current_time
@@ -234,13 +456,11 @@ class EnhancedPlayer:
         
         if bullet_manager:
             # Use bullet manager if provided
-            if 'multi_shot' in self.active_powerups:
+            if self._multi_shot:
                 # Multi-shot: 3 bullets in a spread
-                for i, angle in enumerate([-0.3, 0, 0.3]):
-                    vel_x = math.sin(angle) * 20
-                    vel_y = -BULLET_SPEED
+                for vel_x in _MULTISHOT_OFFSETS:
                     bullet = bullet_manager.create_player_bullet(
-                        self.x + vel_x, self.y - 20, vel_x, vel_y, self.bullet_damage
+                        self.x + vel_x, self.y - 20, vel_x, -BULLET_SPEED, self.bullet_damage
                     )
                     bullets.append(bullet)
             else:
@@ -251,13 +471,11 @@ class EnhancedPlayer:
                 bullets.append(bullet)
         else:
             # Fallback to creating bullet objects directly
-            from bullet_enhanced import Bullet
-            
-            if 'multi_shot' in self.active_powerups:
+            if self._multi_shot:
                 # Multi-shot: 3 bullets in a spread
-                for i, angle in enumerate([-0.3, 0, 0.3]):
+                for offset_x in _MULTISHOT_OFFSETS:
                     bullet = Bullet(
-                        self.x + math.sin(angle) * 20,
+                        self.x + offset_x,
                         self.y - 20,
                         0,
                         -BULLET_SPEED,
@@ -281,7 +499,7 @@ class EnhancedPlayer:
     
     def use_special_ability(self):
         """Use special ability (time freeze or homing missiles)."""
-        current_time = time.time()
+        current_time = self._now
         
         if current_time - self.last_special_use < self.special_ability_cooldown:
             return False
@@ -292,36 +510,45 @@ class EnhancedPlayer:
         self.time_freeze_active = True
         self.time_freeze_timer = TIME_FREEZE_DURATION
         
-        print("Special ability activated: Time Freeze")
+        _log.debug("Special ability activated: Time Freeze")
         return True
     
     def apply_powerup(self, powerup_type):
         """Apply a power-up effect."""
-        if powerup_type.value == 'health':
-            self.health = min(self.max_health, self.health + 25)
-        elif powerup_type.value == 'shield':
-            self.active_powerups['shield'] = True
-            self.powerup_timers['shield'] = POWERUP_DURATION
-            self.invulnerable = True
-            self.invulnerability_timer = POWERUP_DURATION
-            self.shield_effect = 1.0
-        elif powerup_type.value == 'rapid_fire':
-            self.active_powerups['rapid_fire'] = True
-            self.powerup_timers['rapid_fire'] = POWERUP_DURATION
-        elif powerup_type.value == 'multi_shot':
-            self.active_powerups['multi_shot'] = True
-            self.powerup_timers['multi_shot'] = POWERUP_DURATION
-        elif powerup_type.value == 'screen_clear':
-            # This will be handled by the game manager
-            pass
-        elif powerup_type.value == 'time_slow':
-            self.active_powerups['time_slow'] = True
-            self.powerup_timers['time_slow'] = POWERUP_DURATION
-        elif powerup_type.value == 'homing':
-            self.active_powerups['homing'] = True
-            self.powerup_timers['homing'] = POWERUP_DURATION
-        
-        print(f"Power-up applied: {powerup_type.value}")
+        name = powerup_type.value
+        handler = self._POWERUP_HANDLERS.get(name)
+        if handler is not None:
+            handler(self, name)
+        
+        self._recompute_powerup_derived()
+        
+        _log.debug("Power-up applied: %s", name)
+    
+    def _apply_health(self, name: str):
+        """Restore health."""
+        self.health = min(self.max_health, self.health + 25)
+    
+    def _apply_shield(self, name: str):
+        """Start the shield and its matching invulnerability window."""
+        self._start_timed_powerup(name)
+        self.invulnerable = True
+        self.invulnerability_timer = POWERUP_DURATION
+        self.shield_effect = 1.0
+    
+    def _start_timed_powerup(self, name: str):
+        """Activate a timed power-up for the full duration."""
+        self.active_powerups[name] = True
+        self._powerup_timers[POWERUP_INDEX[name]] = POWERUP_DURATION
+    
+    # Power-up value -> handler; screen_clear is handled by the game manager
+    _POWERUP_HANDLERS = {
+        'health': _apply_health,
+        'shield': _apply_shield,
+        'rapid_fire': _start_timed_powerup,
+        'multi_shot': _start_timed_powerup,
+        'time_slow': _start_timed_powerup,
+        'homing': _start_timed_powerup,
+    }
     
     def take_damage(self, damage: int):
         """Take damage with invulnerability check."""
@@ -335,33 +562,66 @@ class EnhancedPlayer:
         self.invulnerable = True
         self.invulnerability_timer = PLAYER_INVULNERABILITY_TIME
         
-        print(f"Player took {damage} damage, health: {self.health}")
+        _log.debug("Player took %s damage, health: %s", damage, self.health)
         return True
     
-    def render(self, screen: pygame.Surface):
+    def render(self, screen: pygame.Surface, _ceil=math.ceil, _degrees=math.degrees):
         """Render the player with all visual effects."""
         # Render trail particles
         self._render_trail(screen)
         
         # Calculate render position
-        render_x = int(self.x)
-        render_y = int(self.y)
+        render_x = int(self._render_x())
+        render_y = int(self._render_y())
         
         # Invulnerability flashing
-        if self.invulnerable and int(time.time() * 10) % 2:
-            alpha = 128
-        else:
-            alpha = 255
+        alpha = 128 if (self.invulnerable and self._flash_on) else 255
         
         # Damage flash effect
         if self.damage_flash > 0:
-            flash_intensity = int(self.damage_flash * 255)
+            flash_level = min(_FLASH_LEVELS, _ceil(self.damage_flash * 2 * _FLASH_LEVELS))
+        else:
+            flash_level = 0
+        
+        # Cached ship sprite, rotated to the nearest angle bucket
+        bucket = int(_degrees(self.sprite_angle) / _ROTATION_STEP) * _ROTATION_STEP
+        if bucket:
+            key = (bucket, flash_level)
+            player_surface = self._rot_cache.get(key)
+            if player_surface is None:
+                player_surface = self._build_rotated(bucket, flash_level)
+            else:
+                self._rot_cache.move_to_end(key)
+        else:
+            player_surface = self._get_ship_surface(flash_level)
+        
+        # Apply alpha
+        player_surface.set_alpha(alpha)
+        
+        # Blit to screen
+        rect = player_surface.get_rect(center=(render_x, render_y))
+        screen.blit(player_surface, rect)
+        
+        # Render shield effect
+        if self.shield_effect > 0:
+            self._render_shield_effect(screen, render_x, render_y)
+        
+        # Render power-up indicators
+        self._render_powerup_indicators(screen)
+    
+    def _get_ship_surface(self, flash_level: int) -> pygame.Surface:
+        """Get the unrotated ship sprite for a damage flash level."""
+        surface = self._ship_surfaces.get(flash_level)
+        if surface is not None:
+            return surface
+        
+        if flash_level:
+            flash_intensity = int(flash_level / (2 * _FLASH_LEVELS) * 255)
             color = (255, 255 - flash_intensity, 255 - flash_intensity)
         else:
             color = PLAYER_COLOR
         
-        # Create player surface
-        player_surface = pygame.Surface(self.size, pygame.SRCALPHA)
+        surface = pygame.Surface(self.size, pygame.SRCALPHA)
         
         # Draw player shape (triangle pointing up)
         points = [
@@ -369,62 +629,74 @@ class EnhancedPlayer:
             (0, self.size[1]),       # Bottom left
             (self.size[0], self.size[1])  # Bottom right
         ]
-        pygame.draw.polygon(player_surface, color, points)
+        pygame.draw.polygon(surface, color, points)
         
         # Add details
-        pygame.draw.polygon(player_surface, WHITE, [
+        pygame.draw.polygon(surface, WHITE, [
             (self.size[0] // 2, 5),
             (self.size[0] // 2 - 3, self.size[1] - 10),
             (self.size[0] // 2 + 3, self.size[1] - 10)
         ])
         
-        # Apply rotation
-        if abs(self.sprite_angle) > 0.01:
-            player_surface = pygame.transform.rotate(player_surface, math.degrees(self.sprite_angle))
-        
-        # Apply alpha
-        player_surface.set_alpha(alpha)
-        
-        # Blit to screen
-        rect = player_surface.get_rect(center=(render_x, render_y))
-        screen.blit(player_surface, rect)
-        
-        # Render shield effect
-        if self.shield_effect > 0:
-            self._render_shield_effect(screen, render_x, render_y)
-        
-        # Render power-up indicators
-        self._render_powerup_indicators(screen)
+        self._ship_surfaces[flash_level] = surface
+        return surface
+    
+    def _build_rotated(self, bucket: int, flash_level: int) -> pygame.Surface:
+        """Rotate the ship sprite for an angle bucket and add it to the LRU cache."""
+        surface = pygame.transform.rotate(self._get_ship_surface(flash_level), bucket)
+        self._rot_cache[(bucket, flash_level)] = surface
+        if len(self._rot_cache) > _ROT_CACHE_LIMIT:
+            self._rot_cache.popitem(last=False)
+        return surface
     
     def _render_trail(self, screen: pygame.Surface):
         """Render engine trail particles."""
-        for x, y, alpha in self.trail_particles:
+        n = self.trail_count
+        surfaces = self._trail_surfaces
+        
+        # Dots carry their own alpha, so the whole trail goes out in one blits() call
+        blit_sequence = []
+        for x, y, alpha in zip(self.trail_x[:n], self.trail_y[:n], self.trail_alpha[:n]):
             if alpha > 0:
-                color = (*UI_PRIMARY, int(alpha * 255))
-                size = int(alpha * 8)
-                if size > 0:
-                    trail_surface = pygame.Surface((size, size), pygame.SRCALPHA)
-                    pygame.draw.circle(trail_surface, color, (size // 2, size // 2), size // 2)
-                    screen.blit(trail_surface, (int(x - size // 2), int(y - size // 2)))
-    
-    def _render_shield_effect(self, screen: pygame.Surface, x: int, y: int):
+                trail_surface = surfaces[int(alpha * _TRAIL_LEVELS)]
+                if trail_surface is not None:
+                    half = trail_surface.get_width() // 2
+                    blit_sequence.append((trail_surface, (int(x - half), int(y - half))))
+        
+        if blit_sequence:
+            screen.blits(blit_sequence, doreturn=False)
+    
+    def _render_shield_effect(self, screen: pygame.Surface, x: int, y: int, _sin=math.sin):
         """Render shield visual effect."""
-        shield_radius = int(max(self.size) * 0.8 * (0.8 + 0.2 * math.sin(time.time() * 5)))
+        shield_radius = int(max(self.size) * 0.8 * (0.8 + 0.2 * _sin(self._now * 5)))
         shield_alpha = int(self.shield_effect * 100)
 
-        # Create shield surface
-        shield_surface = pygame.Surface((shield_radius * 2, shield_radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(shield_surface, (*POWERUP_SHIELD, shield_alpha), 
-                          (shield_radius, shield_radius), shield_radius, 3)
+        # The pulse only spans a handful of integer radii, so rings are cached
+        # at full alpha and faded with surface alpha
+        shield_surface = self._shield_cache.get(shield_radius)
+        if shield_surface is None:
+            shield_surface = pygame.Surface((shield_radius * 2, shield_radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(shield_surface, POWERUP_SHIELD, 
+                              (shield_radius, shield_radius), shield_radius, 3)
+            shield_surface = _convert(shield_surface)
+            self._shield_cache[shield_radius] = shield_surface
+        shield_surface.set_alpha(shield_alpha)
         
         screen.blit(shield_surface, (x - shield_radius, y - shield_radius))
     
+    def _active_powerup_timers(self) -> List[Tuple[str, float]]:
+        """Get (name, remaining time) for each running timed power-up."""
+        timers = self._powerup_timers
+        if np is not None:
+            return [(_TIMED_POWERUPS[i], float(timers[i])) for i in np.flatnonzero(timers > 0).tolist()]
+        return [(name, timer) for name, timer in zip(_TIMED_POWERUPS, timers) if timer > 0]
+    
     def _render_powerup_indicators(self, screen: pygame.Surface):
         """Render active power-up indicators."""
         indicator_y = 50
         indicator_x = SCREEN_WIDTH - 200
         
-        for i, (powerup_type, timer) in enumerate(self.powerup_timers.items()):
+        for i, (powerup_type, timer) in enumerate(self._active_powerup_timers()):
             # Background
             bg_rect = pygame.Rect(indicator_x, indicator_y + i * 30, 150, 25)
             pygame.draw.rect(screen, UI_SECONDARY, bg_rect)
@@ -438,14 +710,16 @@ class EnhancedPlayer:
             color = POWERUP_TYPES.get(powerup_type, {}).get('color', WHITE)
             pygame.draw.rect(screen, color, timer_rect)
             
-            # Text
-            font = pygame.font.Font(None, 20)
-            text = font.render(powerup_type.replace('_', ' ').title(), True, WHITE)
+            # Text (labels never change, so each is rendered once)
+            text = self._indicator_labels.get(powerup_type)
+            if text is None:
+                text = self._indicator_font.render(powerup_type.replace('_', ' ').title(), True, WHITE)
+                self._indicator_labels[powerup_type] = text
             screen.blit(text, (indicator_x + 5, indicator_y + i * 30 + 5))
     
     def get_special_ability_cooldown_remaining(self) -> float:
         """Get remaining cooldown time for special ability."""
-        current_time = time.time()
+        current_time = self._now
         remaining = self.special_ability_cooldown - (current_time - self.last_special_use)
         return max(0, remaining)
     
@@ -15,11 +15,53 @@ import pygame
 import math
 import random
 import time
-from typing import List, Tuple, Dict
+from array import array
+from itertools import accumulate
+from typing import List, Tuple, Dict, Optional
 from enum import Enum
 
 from settings_enhanced import *
 
+try:
+    import numpy as np
+except ImportError:
+    np = None  # NumPy is optional; particles fall back to array.array buffers
+
+if np is not None:
+    from _particle_kernel import step_particles
+
+def _warm_particle_kernel():
+    """Run the particle step once on empty arrays, so a JIT compile happens at setup."""
+    empty = np.zeros(0, np.float32)
+    step_particles(empty, empty, empty, empty, empty, empty, np.zeros(0, np.bool_), 0.0)
+
+# Sine lookup table for the per-frame bob/pulse animation
+_SIN_LUT_SIZE = 1024
+_SIN_LUT = array('f', [math.sin(2 * math.pi * i / _SIN_LUT_SIZE) for i in range(_SIN_LUT_SIZE)])
+_SIN_LUT_SCALE = _SIN_LUT_SIZE / (2 * math.pi)
+
+def _fast_sin(x: float) -> float:
+    """Table-based sine, accurate to the 1024-step LUT resolution."""
+    return _SIN_LUT[int(x * _SIN_LUT_SCALE) & (_SIN_LUT_SIZE - 1)]
+
+# Each power-up owns a fixed block of particle slots in its manager's arrays
+_PARTICLES_PER_POWERUP = 8
+_PARTICLE_BLOCK_GROWTH = 16  # Blocks added whenever the arrays run out
+
+# Pre-drawn particle discs keyed by (color, size, alpha level)
+_PARTICLE_ALPHA_LEVELS = 8
+_particle_sprites: Dict[Tuple[Tuple[int, int, int], int, int], pygame.Surface] = {}
+
+def _build_particle_sprites():
+    """Draw every particle disc for the power-up palette (sizes 1-3)."""
+    for color in _PU_COLOR.values():
+        for size in range(1, 4):
+            for level in range(_PARTICLE_ALPHA_LEVELS):
+                alpha = (2 * level + 1) * 255 // (2 * _PARTICLE_ALPHA_LEVELS)
+                surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+                pygame.draw.circle(surface, (*color, alpha), (size, size), size)
+                _particle_sprites[(color, size, level)] = surface
+
 class PowerUpType(Enum):
     """Power-up type enumeration."""
     HEALTH = "health"
@@ -30,9 +72,40 @@ class PowerUpType(Enum):
     TIME_SLOW = "time_slow"
     HOMING = "homing"
 
+# POWERUP_TYPES frozen into per-type tables at import (read-only), plus the
+# spawn distribution derived from them
+_PU_TYPES = tuple(PowerUpType(name) for name in POWERUP_TYPES)
+_PU_COLOR = {powerup_type: POWERUP_TYPES[powerup_type.value]['color'] for powerup_type in _PU_TYPES}
+_PU_WEIGHT = {powerup_type: POWERUP_TYPES[powerup_type.value]['weight'] for powerup_type in _PU_TYPES}
+_PU_CUM_WEIGHTS = list(accumulate(_PU_WEIGHT[powerup_type] for powerup_type in _PU_TYPES))
+
+# SCREEN_CLEAR explosion star for the fixed 24x24 power-up size
+_STAR_POINTS = [
+    (12 + math.cos(i * math.pi / 4) * (10 if i % 2 == 0 else 6),
+     12 + math.sin(i * math.pi / 4) * (10 if i % 2 == 0 else 6))
+    for i in range(8)
+]
+
+# Rare drops, picked with a single random bit
+_RARE_TYPES = (PowerUpType.HOMING, PowerUpType.TIME_SLOW)
+
 class PowerUp:
     """Enhanced power-up class with effects and animations."""
     
+    # Sprites shared by every power-up of a type: the unrotated shape, glow discs
+    # keyed by (type, radius) and rotated shapes keyed by (type, 10-degree step)
+    _shape_cache: Dict[PowerUpType, pygame.Surface] = {}
+    _glow_cache: Dict[Tuple[PowerUpType, int], pygame.Surface] = {}
+    _rot_cache: Dict[Tuple[PowerUpType, int], pygame.Surface] = {}
+    
+    # Expiry bounds
+    _CUTOFF_Y = SCREEN_HEIGHT + 50
+    _MAX_LIFETIME = 15.0
+    
+    # Final rotated-and-pulsed sprites keyed by (type, rotation step, scale step)
+    _SCALE_STEPS = 32
+    _scaled_cache: Dict[Tuple[PowerUpType, int, int], pygame.Surface] = {}
+    
     def __init__(self, x: float, y: float, powerup_type: PowerUpType):
         """Initialize a power-up."""
         self.x = x
@@ -47,60 +120,41 @@ class PowerUp:
         self.lifetime = 0
         
         # Visual effects
-        self.color = POWERUP_TYPES[powerup_type.value]['color']
+        self.color = _PU_COLOR[powerup_type]
         self.glow_intensity = 1.0
         self.rotation = 0
         self.pulse_phase = random.random() * math.pi * 2
-        self.particles = []
+        self.particle_block: Optional[int] = None  # Assigned by PowerUpManager
         
         # Audio
         self.collected = False
         
-        print(f"Created {powerup_type.value} power-up at ({x}, {y})")
+        if DEBUG_MODE:
+            print(f"Created {powerup_type.value} power-up at ({x}, {y})")
     
-    def update(self, dt: float):
-        """Update power-up state."""
+    def update(self, dt: float, time_scale: float = 1.0):
+        """Update power-up state (dt already scaled; time_scale slows movement)."""
         self.lifetime += dt
         
         # Movement with floating effect
-        self.y += self.velocity_y * dt * 60
-        float_offset = math.sin(self.lifetime * self.float_frequency) * self.float_amplitude
+        self.y += self.velocity_y * dt * 60 * time_scale
+        
+        # Below the screen it is only falling out to expire; skip the animation
+        if self.y > SCREEN_HEIGHT:
+            return
+        
+        float_offset = _fast_sin(self.lifetime * self.float_frequency * time_scale) * self.float_amplitude
         
         # Visual effects
-        self.rotation += dt * 90  # Rotate 90 degrees per second
+        self.rotation = (self.rotation + dt * 90) % 360  # Rotate 90 degrees per second
         self.pulse_phase += dt * 4
-        self.glow_intensity = 0.7 + 0.3 * math.sin(self.pulse_phase)
-        
-        # Update particles
-        self._update_particles(dt)
-        
-        # Add new particles
-        if len(self.particles) < 8:
-            self.particles.append({
-                'x': self.x + random.randint(-10, 10),
-                'y': self.y + random.randint(-10, 10),
-                'vel_x': random.uniform(-20, 20),
-                'vel_y': random.uniform(-20, 20),
-                'alpha': 1.0,
-                'size': random.randint(1, 3),
-                'lifetime': 0
-            })
-    
-    def _update_particles(self, dt: float):
-        """Update power-up particles."""
-        for particle in self.particles[:]:
-            particle['lifetime'] += dt
-            particle['x'] += particle['vel_x'] * dt
-            particle['y'] += particle['vel_y'] * dt
-            particle['alpha'] = max(0, 1.0 - particle['lifetime'] * 2)
-            
-            if particle['alpha'] <= 0 or particle['lifetime'] > 1.0:
-                self.particles.remove(particle)
+        self.glow_intensity = 0.7 + 0.3 * _fast_sin(self.pulse_phase)
     
     def is_expired(self) -> bool:
         """Check if power-up should be removed."""
-        return self.y > SCREEN_HEIGHT + 50 or self.lifetime > 15.0
-def get_description(self) -> str:
+        return self.y > self._CUTOFF_Y or self.lifetime > self._MAX_LIFETIME
+    
+    def get_description(self) -> str:
         """Get power-up description."""
         descriptions = {
             PowerUpType.HEALTH: "Restores 25 health points",
@@ -114,45 +168,58 @@ def get_description(self) -> str:
         return descriptions.get(self.type, "Unknown power-up")
     
     def render(self, screen: pygame.Surface):
-        """Render the power-up with effects."""
-        # Render particles
-        for particle in self.particles:
-            if particle['alpha'] > 0:
-                color = (*self.color, int(particle['alpha'] * 255))
-                size = int(particle['size'])
-                if size > 0:
-                    particle_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-                    pygame.draw.circle(particle_surface, color, (size, size), size)
-                    screen.blit(particle_surface, (int(particle['x'] - size), int(particle['y'] - size)))
-        
-        # Render glow effect
+        """Render the power-up with effects (its particles are drawn by the manager)."""
+        screen.blits(self.get_blits(), doreturn=False)
+    
+    def get_blits(self) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Get the (surface, position) blits for the glow and body, in draw order."""
+        blits = []
+        
+        # Glow effect
         glow_size = int(max(self.size) * 1.5 * self.glow_intensity)
         if glow_size > 0:
-            glow_surface = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
-            glow_color = (*self.color, 64)
-            pygame.draw.circle(glow_surface, glow_color, (glow_size, glow_size), glow_size)
-            screen.blit(glow_surface, (int(self.x - glow_size), int(self.y - glow_size)))
-        
-        # Create power-up surface
-        powerup_surface = pygame.Surface(self.size, pygame.SRCALPHA)
-        
-        # Draw power-up shape based on type
-        self._render_powerup_shape(powerup_surface)
-        
-        # Apply rotation
-        if abs(self.rotation) > 0.01:
-            powerup_surface = pygame.transform.rotate(powerup_surface, self.rotation)
+            glow_surface = self._glow_cache.get((self.type, glow_size))
+            if glow_surface is None:
+                glow_surface = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
+                glow_color = (*self.color, 64)
+                pygame.draw.circle(glow_surface, glow_color, (glow_size, glow_size), glow_size)
+                self._glow_cache[(self.type, glow_size)] = glow_surface
+            blits.append((glow_surface, (int(self.x - glow_size), int(self.y - glow_size))))
+        
+        # Cached shape, rotated to the nearest 10 degrees and scaled to the
+        # nearest pulse step; transforms only run on a cache miss
+        rotation_step = int(self.rotation // 10) % 36
+        scale_step = int((0.9 + 0.1 * _fast_sin(self.pulse_phase)) * self._SCALE_STEPS)
+        key = (self.type, rotation_step, scale_step)
+        powerup_surface = self._scaled_cache.get(key)
+        if powerup_surface is None:
+            powerup_surface = self._get_rotated_shape(rotation_step)
+            if scale_step != self._SCALE_STEPS:
+                scale = scale_step / self._SCALE_STEPS
+                new_size = (int(powerup_surface.get_width() * scale), 
+                           int(powerup_surface.get_height() * scale))
+                powerup_surface = pygame.transform.scale(powerup_surface, new_size)
+            self._scaled_cache[key] = powerup_surface
         
-        # Apply pulsing scale
-        scale = 0.9 + 0.1 * math.sin(self.pulse_phase)
-        if scale != 1.0:
-            new_size = (int(powerup_surface.get_width() * scale), 
-                       int(powerup_surface.get_height() * scale))
-            powerup_surface = pygame.transform.scale(powerup_surface, new_size)
-        
-        # Blit to screen
         rect = powerup_surface.get_rect(center=(int(self.x), int(self.y)))
-        screen.blit(powerup_surface, rect)
+        blits.append((powerup_surface, rect.topleft))
+        return blits
+    
+    def _get_rotated_shape(self, step: int) -> pygame.Surface:
+        """Get this type's shape rotated by step * 10 degrees, building it once."""
+        rotated = self._rot_cache.get((self.type, step))
+        if rotated is not None:
+            return rotated
+        
+        shape = self._shape_cache.get(self.type)
+        if shape is None:
+            shape = pygame.Surface(self.size, pygame.SRCALPHA)
+            self._render_powerup_shape(shape)
+            self._shape_cache[self.type] = shape
+        
+        rotated = pygame.transform.rotate(shape, step * 10) if step else shape
+        self._rot_cache[(self.type, step)] = rotated
+        return rotated
     
     def _render_powerup_shape(self, surface: pygame.Surface):
         """Render power-up shape based on type."""
@@ -205,18 +272,8 @@ def get_description(self) -> str:
         
         elif self.type == PowerUpType.SCREEN_CLEAR:
             # Explosion star
-            points = []
-            for i in range(8):
-                angle = i * math.pi / 4
-                if i % 2 == 0:
-                    radius = self.size[0] // 2 - 2
-                else:
-                    radius = self.size[0] // 4
-                x = center_x + math.cos(angle) * radius
-                y = center_y + math.sin(angle) * radius
-                points.append((x, y))
-            pygame.draw.polygon(surface, self.color, points)
-            pygame.draw.polygon(surface, WHITE, points, 1)
+            pygame.draw.polygon(surface, self.color, _STAR_POINTS)
+            pygame.draw.polygon(surface, WHITE, _STAR_POINTS, 1)
         
         elif self.type == PowerUpType.TIME_SLOW:
             # Clock/hourglass
@@ -244,7 +301,21 @@ class PowerUpManager:
         self.spawn_cooldown = 0
         self.min_spawn_delay = 2.0  # Minimum seconds between spawns
         
-        print("Power-Up Manager initialized successfully!")
+        # Power-up particles as parallel arrays (SoA); block b holds the slots
+        # [b * _PARTICLES_PER_POWERUP, (b + 1) * _PARTICLES_PER_POWERUP)
+        self._rng = np.random.default_rng() if np is not None else None
+        self._block_owners: List[Optional[PowerUp]] = []
+        self._free_blocks: List[int] = []
+        self._grow_particle_blocks()
+        # Upper bound on live particles (releases are not subtracted); 0 skips drawing
+        self._live_particles = 0
+        if np is not None:
+            _warm_particle_kernel()
+        if not _particle_sprites:
+            _build_particle_sprites()
+        
+        if DEBUG_MODE:
+            print("Power-Up Manager initialized successfully!")
     
     def spawn_powerup(self, x: float, y: float, powerup_type: PowerUpType = None) -> PowerUp:
         """
@@ -261,40 +332,190 @@ class PowerUpManager:
             powerup_type = self._choose_random_powerup()
         
         powerup = PowerUp(x, y, powerup_type)
+        self._assign_particle_block(powerup)
         self.powerups.append(powerup)
         
         return powerup
     
     def _choose_random_powerup(self) -> PowerUpType:
         """Choose a random power-up type based on weights."""
-        # Create weighted list
-        weighted_types = []
-        for powerup_type_str, data in POWERUP_TYPES.items():
-            weight = data['weight']
-            powerup_type = PowerUpType(powerup_type_str)
-            weighted_types.extend([powerup_type] * weight)
+        return random.choices(_PU_TYPES, cum_weights=_PU_CUM_WEIGHTS)[0]
+    
+    def _grow_particle_blocks(self):
+        """Add _PARTICLE_BLOCK_GROWTH blocks of particle slots."""
+        first = len(self._block_owners)
+        self._block_owners.extend([None] * _PARTICLE_BLOCK_GROWTH)
+        self._free_blocks.extend(range(len(self._block_owners) - 1, first - 1, -1))
+        
+        old_capacity = first * _PARTICLES_PER_POWERUP
+        capacity = len(self._block_owners) * _PARTICLES_PER_POWERUP
+        if np is not None:
+            def grow(name, dtype):
+                grown = np.zeros(capacity, dtype)
+                if old_capacity:
+                    grown[:old_capacity] = getattr(self, name)
+                setattr(self, name, grown)
+            
+            for name in ('_px', '_py', '_pvx', '_pvy', '_plife', '_palpha'):
+                grow(name, np.float32)
+            grow('_psize', np.int8)
+            grow('_palive', np.bool_)
+            return
+        
+        # Contiguous C-typed buffers: floats for the simulation, bytes for size/alive
+        extra = capacity - old_capacity
+        for name, typecode in (('_px', 'f'), ('_py', 'f'), ('_pvx', 'f'), ('_pvy', 'f'),
+                               ('_plife', 'f'), ('_palpha', 'f'), ('_psize', 'B'),
+                               ('_palive', 'B')):
+            if not old_capacity:
+                setattr(self, name, array(typecode))
+            getattr(self, name).extend(array(typecode, [0]) * extra)
+    
+    def _assign_particle_block(self, powerup: PowerUp):
+        """Give a power-up its own block of particle slots."""
+        if not self._free_blocks:
+            self._grow_particle_blocks()
+        block = self._free_blocks.pop()
+        self._block_owners[block] = powerup
+        powerup.particle_block = block
+    
+    def _release_particle_block(self, powerup: PowerUp):
+        """Kill a power-up's particles and return its block."""
+        block = powerup.particle_block
+        if block is None:
+            return
+        
+        start = block * _PARTICLES_PER_POWERUP
+        end = start + _PARTICLES_PER_POWERUP
+        if np is not None:
+            self._palive[start:end] = False
+        else:
+            self._palive[start:end] = array('B', bytes(_PARTICLES_PER_POWERUP))
         
-        return random.choice(weighted_types)
+        self._block_owners[block] = None
+        self._free_blocks.append(block)
+        powerup.particle_block = None
+    
+    def _update_all_particles(self, dt: float):
+        """Advance every power-up particle, then emit one per power-up with room."""
+        if np is not None:
+            self._live_particles = step_particles(self._px, self._py, self._pvx, self._pvy,
+                                                  self._plife, self._palpha, self._palive, dt)
+            
+            # First free slot in each on-screen owner's block that is not full
+            alive = self._palive.reshape(-1, _PARTICLES_PER_POWERUP)
+            owned = np.fromiter((owner is not None and owner.y <= SCREEN_HEIGHT
+                                 for owner in self._block_owners),
+                                np.bool_, len(self._block_owners))
+            blocks = np.flatnonzero(owned & ~alive.all(axis=1))
+            if not blocks.size:
+                return
+            
+            slots = blocks * _PARTICLES_PER_POWERUP + alive[blocks].argmin(axis=1)
+            owners = [self._block_owners[b] for b in blocks.tolist()]
+            count = len(owners)
+            rng = self._rng
+            self._px[slots] = np.array([o.x for o in owners]) + rng.integers(-10, 11, count)
+            self._py[slots] = np.array([o.y for o in owners]) + rng.integers(-10, 11, count)
+            self._pvx[slots] = rng.uniform(-20, 20, count)
+            self._pvy[slots] = rng.uniform(-20, 20, count)
+            self._palpha[slots] = 1.0
+            self._psize[slots] = rng.integers(1, 4, count)
+            self._plife[slots] = 0
+            self._palive[slots] = True
+            self._live_particles += count
+            return
+        
+        px, py, pvx, pvy = self._px, self._py, self._pvx, self._pvy
+        plife, palpha, palive = self._plife, self._palpha, self._palive
+        live = 0
+        for i in range(len(palive)):
+            if palive[i]:
+                plife[i] += dt
+                px[i] += pvx[i] * dt
+                py[i] += pvy[i] * dt
+                palpha[i] = max(0, 1.0 - plife[i] * 2)
+                if palpha[i] <= 0 or plife[i] > 1.0:
+                    palive[i] = False
+                else:
+                    live += 1
+        
+        for block, owner in enumerate(self._block_owners):
+            if owner is None or owner.y > SCREEN_HEIGHT:
+                continue
+            start = block * _PARTICLES_PER_POWERUP
+            for i in range(start, start + _PARTICLES_PER_POWERUP):
+                if not palive[i]:
+                    px[i] = owner.x + random.randint(-10, 10)
+                    py[i] = owner.y + random.randint(-10, 10)
+                    pvx[i] = random.uniform(-20, 20)
+                    pvy[i] = random.uniform(-20, 20)
+                    palpha[i] = 1.0
+                    self._psize[i] = random.randint(1, 3)
+                    plife[i] = 0
+                    palive[i] = True
+                    live += 1
+                    break
+        self._live_particles = live
+    
+    def _particle_blits(self) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Get a (disc, position) blit for every live power-up particle."""
+        if not self._live_particles:
+            return []
+        
+        if np is not None:
+            live = np.flatnonzero(self._palive)
+            particles = zip(live.tolist(), self._px[live].tolist(), self._py[live].tolist(),
+                            self._palpha[live].tolist(), self._psize[live].tolist())
+        else:
+            particles = ((i, self._px[i], self._py[i], self._palpha[i], self._psize[i])
+                         for i in range(len(self._palive)) if self._palive[i])
+        
+        # Pick a pre-drawn disc per particle
+        owners = self._block_owners
+        max_level = _PARTICLE_ALPHA_LEVELS - 1
+        blit_sequence = []
+        for i, x, y, alpha, size in particles:
+            if alpha > 0 and size > 0:
+                color = owners[i // _PARTICLES_PER_POWERUP].color
+                level = min(max_level, int(alpha * _PARTICLE_ALPHA_LEVELS))
+                blit_sequence.append((_particle_sprites[(color, size, level)],
+                                      (int(x - size), int(y - size))))
+        return blit_sequence
     
     def update(self, dt: float):
         """Update all power-ups."""
         self.spawn_cooldown = max(0, self.spawn_cooldown - dt)
         
-        # Update all power-ups
-        for powerup in self.powerups[:]:
+        # Update all power-ups, keeping the ones that have not expired
+        # (is_expired is inlined against the class bounds)
+        cutoff_y = PowerUp._CUTOFF_Y
+        max_lifetime = PowerUp._MAX_LIFETIME
+        alive = []
+        for powerup in self.powerups:
             powerup.update(dt)
             
-            # Remove expired power-ups
-            if powerup.is_expired():
-                self.powerups.remove(powerup)
+            if powerup.y > cutoff_y or powerup.lifetime > max_lifetime:
+                self._release_particle_block(powerup)
+            else:
+                alive.append(powerup)
+        self.powerups = alive
+        
+        self._update_all_particles(dt)
     
     def render(self, screen: pygame.Surface):
-        """Render all power-ups."""
+        """Render all power-ups (particles, then each glow and body) in one blits() call."""
+        blit_sequence = self._particle_blits()
         for powerup in self.powerups:
-            powerup.render(screen)
+            blit_sequence.extend(powerup.get_blits())
+        
+        if blit_sequence:
+            screen.blits(blit_sequence, doreturn=False)
     
     def clear(self):
         """Clear all power-ups."""
+        for powerup in self.powerups:
+            self._release_particle_block(powerup)
         self.powerups.clear()
     
     def get_powerup_count(self) -> int:
@@ -303,19 +524,15 @@ class PowerUpManager:
     
     def get_powerups_in_area(self, x: float, y: float, radius: float) -> List[PowerUp]:
         """Get power-ups within a certain area."""
-        powerups_in_area = []
-        
-        for powerup in self.powerups:
-            distance = math.sqrt((powerup.x - x)**2 + (powerup.y - y)**2)
-            if distance <= radius:
-                powerups_in_area.append(powerup)
-        
-        return powerups_in_area
+        radius_sq = radius * radius
+        return [powerup for powerup in self.powerups
+                if (powerup.x - x) * (powerup.x - x) + (powerup.y - y) * (powerup.y - y) <= radius_sq]
     
     def remove_powerup(self, powerup: PowerUp) -> bool:
         """Remove a specific power-up."""
         if powerup in self.powerups:
             self.powerups.remove(powerup)
+            self._release_particle_block(powerup)
             return True
         return False
     
@@ -358,10 +575,7 @@ class PowerUpManager:
     
     def spawn_rare_powerup(self, x: float, y: float) -> PowerUp:
         """Spawn a rare power-up (homing or time_slow)."""
-        rare_types = [PowerUpType.HOMING, PowerUpType.TIME_SLOW]
-        powerup_type = random.choice(rare_types)
-        
-        return self.spawn_powerup(x, y, powerup_type)
+        return self.spawn_powerup(x, y, _RARE_TYPES[random.getrandbits(1)])
     
     def create_powerup_explosion(self, center_x: float, center_y: float, 
                                 count: int = 5) -> List[PowerUp]:
@@ -391,68 +605,76 @@ class PowerUpManager:
             'effects': []
         }
         
-        if powerup_type == PowerUpType.HEALTH:
-            if player:
-                old_health = player.health
-                player.health = min(player.max_health, player.health + 25)
-                healed = player.health - old_health
-                result['message'] = f"Restored {healed} health"
-                result['effects'].append('health_restored')
-        
-        elif powerup_type == PowerUpType.SHIELD:
-            if player:
-                player.apply_powerup(powerup_type)
-                result['message'] = "Shield activated"
-                result['effects'].append('shield_activated')
-        
-        elif powerup_type == PowerUpType.RAPID_FIRE:
-            if player:
-                player.apply_powerup(powerup_type)
-                result['message'] = "Rapid fire enabled"
-                result['effects'].append('rapid_fire_enabled')
-        
-        elif powerup_type == PowerUpType.MULTI_SHOT:
-            if player:
-                player.apply_powerup(powerup_type)
-                result['message'] = "Multi-shot enabled"
-                result['effects'].append('multi_shot_enabled')
-        
-        elif powerup_type == PowerUpType.SCREEN_CLEAR:
-            if enemy_manager and particle_manager:
-                destroyed_count = len(enemy_manager.enemies)
-                
-                # Create explosion effects for each enemy
-                for enemy in enemy_manager.enemies:
-                    particle_manager.create_explosion(enemy.x, enemy.y, 15)
-                
-                # Clear all enemies
-                enemy_manager.clear()
-                
-                # Create screen-wide effect
-                particle_manager.create_screen_clear_effect(
-                    SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2
-                )
-                
-                result['message'] = f"Destroyed {destroyed_count} enemies"
-                result['effects'].append('screen_cleared')
-        
-        elif powerup_type == PowerUpType.TIME_SLOW:
-            if player:
-                player.apply_powerup(powerup_type)
-                result['message'] = "Time slowed"
-                result['effects'].append('time_slowed')
-        
-        elif powerup_type == PowerUpType.HOMING:
-            if player:
-                player.apply_powerup(powerup_type)
-                result['message'] = "Homing missiles ready"
-                result['effects'].append('homing_enabled')
+        handler = self._EFFECTS.get(powerup_type)
+        if handler is not None:
+            handler(self, powerup_type, player, enemy_manager, bullet_manager,
+                    particle_manager, result)
         
         return result
     
+    def _apply_health(self, powerup_type, player, enemy_manager, bullet_manager,
+                      particle_manager, result: Dict):
+        """Restore player health."""
+        if player:
+            old_health = player.health
+            player.health = min(player.max_health, player.health + 25)
+            healed = player.health - old_health
+            result['message'] = f"Restored {healed} health"
+            result['effects'].append('health_restored')
+    
+    def _apply_player_powerup(self, powerup_type, player, enemy_manager, bullet_manager,
+                              particle_manager, result: Dict):
+        """Hand a timed power-up to the player."""
+        if player:
+            player.apply_powerup(powerup_type)
+            message, effect = self._PLAYER_EFFECT_TEXT[powerup_type]
+            result['message'] = message
+            result['effects'].append(effect)
+    
+    def _apply_screen_clear(self, powerup_type, player, enemy_manager, bullet_manager,
+                            particle_manager, result: Dict):
+        """Destroy every enemy on screen."""
+        if enemy_manager and particle_manager:
+            destroyed_count = len(enemy_manager.enemies)
+            
+            # Create explosion effects for each enemy
+            for enemy in enemy_manager.enemies:
+                particle_manager.create_explosion(enemy.x, enemy.y, 15)
+            
+            # Clear all enemies
+            enemy_manager.clear()
+            
+            # Create screen-wide effect
+            particle_manager.create_screen_clear_effect(
+                SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2
+            )
+            
+            result['message'] = f"Destroyed {destroyed_count} enemies"
+            result['effects'].append('screen_cleared')
+    
+    # Result text for power-ups applied directly to the player
+    _PLAYER_EFFECT_TEXT = {
+        PowerUpType.SHIELD: ("Shield activated", 'shield_activated'),
+        PowerUpType.RAPID_FIRE: ("Rapid fire enabled", 'rapid_fire_enabled'),
+        PowerUpType.MULTI_SHOT: ("Multi-shot enabled", 'multi_shot_enabled'),
+        PowerUpType.TIME_SLOW: ("Time slowed", 'time_slowed'),
+        PowerUpType.HOMING: ("Homing missiles ready", 'homing_enabled'),
+    }
+    
+    # Power-up type -> effect handler
+    _EFFECTS = {
+        PowerUpType.HEALTH: _apply_health,
+        PowerUpType.SHIELD: _apply_player_powerup,
+        PowerUpType.RAPID_FIRE: _apply_player_powerup,
+        PowerUpType.MULTI_SHOT: _apply_player_powerup,
+        PowerUpType.SCREEN_CLEAR: _apply_screen_clear,
+        PowerUpType.TIME_SLOW: _apply_player_powerup,
+        PowerUpType.HOMING: _apply_player_powerup,
+    }
+    
     def get_powerup_rarity(self, powerup_type: PowerUpType) -> str:
         """Get rarity classification of power-up."""
-        weights = POWERUP_TYPES.get(powerup_type.value, {}).get('weight', 0)
+        weights = _PU_WEIGHT.get(powerup_type, 0)
         
         if weights >= 20:
             return "Common"
@@ -471,13 +693,17 @@ class PowerUpManager:
         powerups.append(self.spawn_powerup(boss_x - 30, boss_y, PowerUpType.HEALTH))
         powerups.append(self.spawn_powerup(boss_x + 30, boss_y, PowerUpType.SHIELD))
         
+        # One draw covers every roll: bit 0 is the 50% rare drop, bit 1 picks the
+        # rare type and bits 2-3 are the 25% screen clear
+        roll = random.getrandbits(4)
+        
         # 50% chance for rare power-up
-        if random.random() < 0.5:
-            rare_powerup = self.spawn_rare_powerup(boss_x, boss_y - 40)
+        if roll & 1:
+            rare_powerup = self.spawn_powerup(boss_x, boss_y - 40, _RARE_TYPES[(roll >> 1) & 1])
             powerups.append(rare_powerup)
         
         # 25% chance for screen clear
-        if random.random() < 0.25:
+        if not roll & 0b1100:
             screen_clear = self.spawn_powerup(boss_x, boss_y + 40, PowerUpType.SCREEN_CLEAR)
             powerups.append(screen_clear)
         
@@ -489,22 +715,17 @@ class PowerUpManager:
         self.spawn_cooldown = max(0, self.spawn_cooldown - dt)  # Real time
         
         # Update power-ups with scaled time
-        for powerup in self.powerups[:]:
-            # Save original values
-            original_velocity = powerup.velocity_y
-            original_frequency = powerup.float_frequency
-            
-            # Apply time scale
-            powerup.velocity_y *= time_scale
-            powerup.float_frequency *= time_scale
-            
-            # Update
-            powerup.update(scaled_dt)
-            
-            # Restore original values
-            powerup.velocity_y = original_velocity
-            powerup.float_frequency = original_frequency
+        cutoff_y = PowerUp._CUTOFF_Y
+        max_lifetime = PowerUp._MAX_LIFETIME
+        alive = []
+        for powerup in self.powerups:
+            powerup.update(scaled_dt, time_scale)
             
-            # Remove expired power-ups
-            if powerup.is_expired():
-                self.powerups.remove(powerup)
+            # Drop expired power-ups
+            if powerup.y > cutoff_y or powerup.lifetime > max_lifetime:
+                self._release_particle_block(powerup)
+            else:
+                alive.append(powerup)
+        self.powerups = alive
+        
+        self._update_all_particles(scaled_dt)
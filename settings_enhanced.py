@@ -8,8 +8,16 @@ Comprehensive configuration for Cosmic Defenders Enhanced with
 professional-grade settings for performance, gameplay, and visuals.
 """
 
+import json as _json
 import pygame
+from dataclasses import dataclass as _dataclass
 from pathlib import Path
+from types import MappingProxyType as _MappingProxyType
+
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None  # orjson is optional; save files are parsed with the json module
 
 # ============================================================================
 # DISPLAY SETTINGS
@@ -232,6 +240,8 @@ MAX_PARTICLES = 500
 EXPLOSION_PARTICLES = 20
 TRAIL_PARTICLES = 5
 STAR_COUNT = 200
+DEBRIS_SHAPE_COUNT = 16  # Pre-generated debris polygons shared by all particles
+SPRITE_CACHE_LIMIT = 2048  # Cached particle sprites before the cache is reset
 
 # ============================================================================
 # AUDIO SETTINGS
@@ -297,6 +307,13 @@ LEADERBOARD_FILE = SAVE_DIR / "leaderboard.json"
 SETTINGS_FILE = SAVE_DIR / "settings.json"
 PROGRESS_FILE = SAVE_DIR / "progress.json"
 
+def load_save_file(path):
+    """Read a JSON save file in one call and parse the bytes."""
+    data = path.read_bytes()
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return _json.loads(data)
+
 # Ensure directories exist
 SAVE_DIR.mkdir(exist_ok=True)
 ASSETS_DIR.mkdir(exist_ok=True)
@@ -310,9 +327,14 @@ FONTS_DIR.mkdir(exist_ok=True)
 # Optimization flags
 ENABLE_VSYNC = True
 ENABLE_PARTICLE_CULLING = True
+PARTICLE_POOL_ENABLED = True  # Reuse Particle instances instead of reallocating
 ENABLE_SOUND_POOLING = True
 MAX_CONCURRENT_SOUNDS = 32
 
+# Fixed-timestep player logic
+PLAYER_FIXED_DT = 1.0 / 60  # Input/physics/timer step, independent of render rate
+MAX_FIXED_STEPS = 5         # Catch-up steps allowed per frame after a stall
+
 # Culling distances
 PARTICLE_CULL_DISTANCE = SCREEN_WIDTH + 100
 ENEMY_CULL_DISTANCE = SCREEN_HEIGHT + 100
@@ -328,40 +350,62 @@ SHOW_PARTICLE_COUNT = DEBUG_MODE
 # ============================================================================
 # GAME BALANCE
 # ============================================================================
-# Daily missions
-DAILY_MISSIONS = [
-    {"type": "score", "target": 5000, "reward": "unlock_level"},
-    {"type": "enemies", "target": 100, "reward": "bonus_points"},
-    {"type": "survival", "target": 300, "reward": "extra_life"},
-    {"type": "powerups", "target": 10, "reward": "powerup_boost"}
-]
+@_dataclass(frozen=True)
+class Mission:
+    """Immutable daily mission definition."""
+    __slots__ = ('type', 'target', 'reward')
+    type: str
+    target: int
+    reward: str
+
+@_dataclass(frozen=True)
+class Achievement:
+    """Immutable achievement definition."""
+    __slots__ = ('name', 'description')
+    name: str
+    description: str
 
-# Achievement system
-ACHIEVEMENTS = {
-    'first_kill': {'name': 'First Blood', 'description': 'Destroy your first enemy'},
-    'score_1k': {'name': 'Rising Star', 'description': 'Score 1,000 points'},
-    'score_10k': {'name': 'Space Ace', 'description': 'Score 10,000 points'},
-    'score_50k': {'name': 'Cosmic Legend', 'description': 'Score 50,000 points'},
-    'boss_killer': {'name': 'Boss Hunter', 'description': 'Defeat your first boss'},
-    'survivor': {'name': 'Survivor', 'description': 'Survive for 5 minutes'},
-    'perfectionist': {'name': 'Perfect Run', 'description': 'Complete a level without taking damage'}
-}
+# Daily missions
+DAILY_MISSIONS = (
+    Mission("score", 5000, "unlock_level"),
+    Mission("enemies", 100, "bonus_points"),
+    Mission("survival", 300, "extra_life"),
+    Mission("powerups", 10, "powerup_boost")
+)
+
+# Achievement system (read-only view)
+ACHIEVEMENTS = _MappingProxyType({
+    'first_kill': Achievement('First Blood', 'Destroy your first enemy'),
+    'score_1k': Achievement('Rising Star', 'Score 1,000 points'),
+    'score_10k': Achievement('Space Ace', 'Score 10,000 points'),
+    'score_50k': Achievement('Cosmic Legend', 'Score 50,000 points'),
+    'boss_killer': Achievement('Boss Hunter', 'Defeat your first boss'),
+    'survivor': Achievement('Survivor', 'Survive for 5 minutes'),
+    'perfectionist': Achievement('Perfect Run', 'Complete a level without taking damage')
+})
 
 # ============================================================================
 # INPUT SETTINGS
 # ============================================================================
 # Key bindings (customizable)
 KEY_BINDINGS = {
-    'move_up': [pygame.K_w, pygame.K_UP],
-    'move_down': [pygame.K_s, pygame.K_DOWN],
-    'move_left': [pygame.K_a, pygame.K_LEFT],
-    'move_right': [pygame.K_d, pygame.K_RIGHT],
-    'shoot': [pygame.K_SPACE],
-    'special_ability': [pygame.K_x, pygame.K_LSHIFT],
-    'pause': [pygame.K_ESCAPE, pygame.K_p],
-    'menu': [pygame.K_ESCAPE]
+    'move_up': (pygame.K_w, pygame.K_UP),
+    'move_down': (pygame.K_s, pygame.K_DOWN),
+    'move_left': (pygame.K_a, pygame.K_LEFT),
+    'move_right': (pygame.K_d, pygame.K_RIGHT),
+    'shoot': (pygame.K_SPACE,),
+    'special_ability': (pygame.K_x, pygame.K_LSHIFT),
+    'pause': (pygame.K_ESCAPE, pygame.K_p),
+    'menu': (pygame.K_ESCAPE,)
 }
 
+# Reverse lookup for key events; a key bound to several actions maps to the first one
+KEY_TO_ACTION = {}
+for _action, _keys in KEY_BINDINGS.items():
+    for _key in _keys:
+        KEY_TO_ACTION.setdefault(_key, _action)
+del _action, _keys, _key
+
 # Mouse sensitivity
 MOUSE_SENSITIVITY = 1.0
 
@@ -382,3 +426,8 @@ PARALLAX_LAYERS = [
     {'speed': 0.5, 'image': 'bg_mid.png'},
     {'speed': 1.0, 'image': 'bg_near.png'}
 ]
+
+# Wildcard imports get the configuration constants (plus the pygame and Path
+# names they have always carried); helpers are imported by name
+__all__ = ['pygame', 'Path'] + [_name for _name in list(globals())
+                                if _name.isupper() and not _name.startswith('_')]
@@ -9,97 +9,198 @@ This script sets up the game environment, installs dependencies,
 and creates necessary directories and files.
 """
 
+import io
 import os
 import sys
+import json
+import contextlib
+import hashlib
+import threading
 import subprocess
-from pathlib import Path
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+
+# (package, minimum version) - pygame is required, numpy is optional
+DEPENDENCIES = (("pygame", "2.1.0"), ("numpy", "1.21.0"))
+
+DIRECTORIES = (
+    "saves",
+    "assets",
+    "assets/images",
+    "assets/sounds",
+    "assets/fonts",
+    "game/__pycache__"
+)
+
+# Written after a successful setup; holds SETUP_KEY so reruns can skip the work
+SETUP_SENTINEL = os.path.join("saves", ".setup_ok")
+SETUP_KEY = hashlib.sha1(
+    repr((tuple(sys.version_info[:2]), DIRECTORIES, DEPENDENCIES)).encode()
+).hexdigest()
+
+DEFAULT_SETTINGS = {
+    "master_volume": 0.7,
+    "music_volume": 0.5,
+    "sfx_volume": 0.8,
+    "screen_width": 1200,
+    "screen_height": 800,
+    "fullscreen": False,
+    "vsync": True
+}
+
+# Serialized once at import; create_sample_config writes these bytes as-is
+DEFAULT_SETTINGS_JSON = json.dumps(DEFAULT_SETTINGS, indent=2).encode("utf-8")
+
+# Console banners, each emitted with a single write
+BANNER = "\n".join([
+    "=" * 60,
+    "🚀 COSMIC DEFENDERS ENHANCED - SETUP",
+    "=" * 60,
+    ""
+]) + "\n"
+
+SUCCESS_MESSAGE = "\n".join([
+    "",
+    "=" * 60,
+    "✅ SETUP COMPLETED SUCCESSFULLY!",
+    "=" * 60,
+    "",
+    "🎮 TO PLAY THE GAME:",
+    "   python3 launch_enhanced_game.py",
+    "   OR",
+    "   ./start_game.sh (Linux/Mac)",
+    "   OR",
+    "   start_game.bat (Windows)",
+    "",
+    "📖 TO ADD CUSTOM ASSETS:",
+    "   See assets/README.txt for details",
+    "",
+    "🧪 TO TEST COMPONENTS:",
+    "   python3 test_enhanced_game.py",
+    "",
+    "🚀 ENJOY THE GAME!",
+    "   Defend the galaxy and become a Cosmic Legend! 🌌",
+    ""
+]) + "\n"
+
+# Asset files to pull into the OS page cache before the game first loads them
+ASSET_ROOT = "assets"
+WARM_BLOCK_SIZE = 1 << 16
+WARM_JOIN_TIMEOUT = 2.0
+
+# Write through one large buffer so each file lands in a single OS write
+WRITE_BUFFER_SIZE = 1 << 16
+
+PIP_INSTALL = [sys.executable, "-m", "pip", "install", "-q",
+               "--disable-pip-version-check", "--no-input"]
+
+def _version_tuple(version):
+    """Leading numeric components of a version string, e.g. '2.1.3.dev8' -> (2, 1, 3)."""
+    parts = []
+    for part in version.split("."):
+        digits = ""
+        for ch in part:
+            if not ch.isdigit():
+                break
+            digits += ch
+        if not digits:
+            break
+        parts.append(int(digits))
+    return tuple(parts)
+
+def _is_installed(package, min_version):
+    """Check a package is importable at min_version without importing it."""
+    if importlib.util.find_spec(package) is None:
+        return False
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+    except ImportError:
+        return True  # Python 3.7: no metadata API, trust the import spec
+    try:
+        return _version_tuple(version(package)) >= _version_tuple(min_version)
+    except PackageNotFoundError:
+        return True  # Importable but not pip-managed (e.g. system package)
 
 def install_dependencies():
     """Install required Python packages."""
     print("Installing dependencies...")
     
+    if all(_is_installed(package, version) for package, version in DEPENDENCIES):
+        print("✓ Dependencies already installed")
+        return True
+    
+    requirements = [f"{package}>={version}" for package, version in DEPENDENCIES]
+    sys.stdout.flush()  # Show buffered progress before pip writes to the console
     try:
-        # Install pygame
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "pygame>=2.1.0"])
-        print("✓ Pygame installed successfully")
-        
-        # Try to install numpy (optional for better sound generation)
+        # One pip run resolves and fetches both packages
+        subprocess.check_call(PIP_INSTALL + requirements)
+        print("✓ Pygame and NumPy installed successfully")
+    except subprocess.CalledProcessError:
+        # NumPy is optional (better sound generation); retry with pygame only
         try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", "numpy>=1.21.0"])
-            print("✓ NumPy installed successfully")
-        except subprocess.CalledProcessError:
+            subprocess.check_call(PIP_INSTALL + requirements[:1])
+            print("✓ Pygame installed successfully")
             print("⚠ NumPy installation failed (optional, game will still work)")
-        
-    except subprocess.CalledProcessError as e:
-        print(f"✗ Error installing dependencies: {e}")
-        return False
+        except subprocess.CalledProcessError as e:
+            print(f"✗ Error installing dependencies: {e}")
+            return False
     
     return True
 
+def make_directories(directories):
+    """Create directories (and parents) once each; returns how many listed ones were new."""
+    listed = {os.path.normpath(directory) for directory in directories}
+    made = set()
+    created = 0
+    for directory in sorted(set(directories), key=lambda d: d.count("/")):
+        path = ""
+        for part in directory.split("/"):
+            path = os.path.join(path, part) if path else part
+            if path in made:
+                continue
+            made.add(path)
+            try:
+                os.mkdir(path)
+                created += path in listed
+            except FileExistsError:
+                pass
+    return created
+
 def create_directories():
     """Create necessary game directories."""
     print("Creating directories...")
     
-    directories = [
-        "saves",
-        "assets",
-        "assets/images",
-        "assets/sounds",
-        "assets/fonts",
-        "game/__pycache__"
-    ]
-    
-    for directory in directories:
-        Path(directory).mkdir(parents=True, exist_ok=True)
-        print(f"✓ Created directory: {directory}")
+    created = make_directories(DIRECTORIES)
+    print(f"✓ {len(DIRECTORIES)} directories ready ({created} newly created)")
+
+def warm_asset_cache():
+    """Prime the OS page cache with every file under the assets directory."""
+    fadvise = getattr(os, "posix_fadvise", None)
+    for root, _, files in os.walk(ASSET_ROOT):
+        for name in files:
+            try:
+                if fadvise is not None:
+                    fd = os.open(os.path.join(root, name), os.O_RDONLY)
+                    try:
+                        fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                    finally:
+                        os.close(fd)
+                else:
+                    # No readahead hint (Windows) - read the file through once
+                    with open(os.path.join(root, name), "rb") as f:
+                        while f.read(WARM_BLOCK_SIZE):
+                            pass
+            except OSError:
+                pass  # Unreadable assets are reported by the game, not setup
 
 def create_placeholder_files():
     """Create placeholder files and documentation."""
     print("Creating placeholder files...")
     
-    # Create assets README
-    assets_readme = """# Assets Directory
-
-This directory contains game assets:
-
-## Images (assets/images/)
-- player.png - Player spaceship sprite
-- enemy_*.png - Enemy sprites
-- bullet.png - Bullet sprite
-- powerup_*.png - Power-up sprites
-- background_*.png - Background images
-- icon.png - Game icon
-
-## Sounds (assets/sounds/)
-- menu_music.ogg - Main menu background music
-- game_music.ogg - Gameplay background music
-- boss_music.ogg - Boss battle music
-- shoot.wav - Shooting sound effect
-- explosion.wav - Explosion sound effect
-- powerup.wav - Power-up collection sound
-- menu_select.wav - Menu selection sound
-- menu_hover.wav - Menu hover sound
-- game_over.wav - Game over sound
-- level_complete.wav - Level completion sound
-- boss_warning.wav - Boss warning sound
-
-## Fonts (assets/fonts/)
-- game_font.ttf - Main game font
-
-## Notes
-- The game will work without these assets using built-in placeholders
-- For the best experience, add high-quality assets
-- Supported image formats: PNG, JPG, BMP
-- Supported audio formats: WAV, OGG, MP3
-- Recommended image sizes:
-  - Player: 40x40 pixels
-  - Enemies: 30x30 to 80x80 pixels
-  - Bullets: 4x10 pixels
-  - Power-ups: 24x24 pixels
-"""
-    
-    with open("assets/README.txt", "w") as f:
-        f.write(assets_readme)
+    # Bytes constant from its own module, loaded straight from the .pyc
+    from _assets_readme import README
+    with open("assets/README.txt", "wb", buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(README)
     
     print("✓ Created assets README")
 
@@ -107,20 +208,8 @@ def create_sample_config():
     """Create sample configuration files."""
     print("Creating sample configuration...")
     
-    # Create sample settings
-    sample_settings = {
-        "master_volume": 0.7,
-        "music_volume": 0.5,
-        "sfx_volume": 0.8,
-        "screen_width": 1200,
-        "screen_height": 800,
-        "fullscreen": False,
-        "vsync": True
-    }
-    
-    import json
-    with open("saves/default_settings.json", "w") as f:
-        json.dump(sample_settings, f, indent=2)
+    with open("saves/default_settings.json", "wb", buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(DEFAULT_SETTINGS_JSON)
     
     print("✓ Created sample settings")
 
@@ -129,14 +218,23 @@ def test_installation():
     print("Testing installation...")
     
     try:
+        # Import check only - pygame.init() would bring up SDL video/audio for nothing
+        if importlib.util.find_spec("pygame") is None:
+            raise ImportError("No module named 'pygame'")
         import pygame
-        pygame.init()
-        pygame.quit()
+        _ = pygame.version.vernum
         print("✓ Pygame test passed")
         
-        # Test game imports
-        sys.path.insert(0, "game")
-        from settings_enhanced import SCREEN_WIDTH, SCREEN_HEIGHT
+        # Test game imports - load settings by file location, leaving sys.path alone
+        settings_path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                     "settings_enhanced.py")
+        spec = importlib.util.spec_from_file_location("settings_enhanced", settings_path)
+        if spec is None or not os.path.exists(settings_path):
+            raise ImportError(f"Game settings not found at {settings_path}")
+        settings = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(settings)
+        if not (settings.SCREEN_WIDTH and settings.SCREEN_HEIGHT):
+            raise ImportError("Game settings define no screen size")
         print("✓ Game modules test passed")
         
         return True
@@ -203,72 +301,94 @@ def check_system_requirements():
 
     return True
 
+def is_setup_current():
+    """Check whether a previous setup ran with the same Python, directories and dependencies."""
+    try:
+        with open(SETUP_SENTINEL, encoding="utf-8") as f:
+            return f.read().strip() == SETUP_KEY
+    except OSError:
+        return False
+
+def mark_setup_complete():
+    """Record the current setup key in the sentinel file."""
+    try:
+        with open(SETUP_SENTINEL, "w", encoding="utf-8") as f:
+            f.write(SETUP_KEY)
+    except OSError as e:
+        print(f"⚠ Could not write setup marker: {e}")
+
+def print_section(title):
+    """Print a setup phase heading in one write."""
+    sys.stdout.write(f"\n{'=' * 40}\n{title}\n{'=' * 40}\n")
+
 def main():
     """Main setup function."""
-    print("=" * 60)
-    print("🚀 COSMIC DEFENDERS ENHANCED - SETUP")
-    print("=" * 60)
-    print()
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        return run_setup()
+    
+    # Coalesce the many small prints into page-sized console writes
+    out = io.TextIOWrapper(buffer, encoding=sys.stdout.encoding,
+                           errors="replace", write_through=False)
+    sys.stdout.flush()
+    try:
+        with contextlib.redirect_stdout(out):
+            return run_setup()
+    finally:
+        out.flush()
+        out.detach()
+
+def run_setup():
+    """Run the setup phases in order."""
+    sys.stdout.write(BANNER)
+    
+    # Nothing changed since the last successful run (override with --force)
+    if "--force" not in sys.argv and is_setup_current():
+        print("✓ Setup already complete (run with --force to redo it)")
+        if not test_installation():
+            print("✗ Installation test failed")
+            return 1
+        return 0
     
     # Check system requirements
     if not check_system_requirements():
         print("✗ System requirements not met")
         return 1
     
-    # Install dependencies
-    print("\n" + "=" * 40)
-    print("📦 INSTALLING DEPENDENCIES")
-    print("=" * 40)
-    if not install_dependencies():
-        print("✗ Failed to install dependencies")
-        print("You can try installing manually:")
-        print("  pip install pygame>=2.1.0")
-        print("  pip install numpy>=1.21.0")
-        return 1
+    # Install dependencies and create directories side by side (pip is the slow part)
+    print_section("📦 INSTALLING DEPENDENCIES / 📁 CREATING DIRECTORIES")
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        installed = executor.submit(install_dependencies)
+        create_directories()
+        if not installed.result():
+            print("✗ Failed to install dependencies")
+            print("You can try installing manually:")
+            print("  pip install pygame>=2.1.0")
+            print("  pip install numpy>=1.21.0")
+            return 1
     
-    # Create directories
-    print("\n" + "=" * 40)
-    print("📁 CREATING DIRECTORIES")
-    print("=" * 40)
-    create_directories()
+    # Read assets in the background while the remaining setup steps run
+    warm_thread = threading.Thread(target=warm_asset_cache, daemon=True)
+    warm_thread.start()
     
-    # Create placeholder files
-    print("\n" + "=" * 40)
-    print("📄 CREATING FILES")
-    print("=" * 40)
-    create_placeholder_files()
-    create_sample_config()
-    create_launch_scripts()
+    # Create placeholder files - independent writes, so run them together
+    print_section("📄 CREATING FILES")
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        for future in [executor.submit(create_placeholder_files),
+                       executor.submit(create_sample_config),
+                       executor.submit(create_launch_scripts)]:
+            future.result()
 
     # Test installation
-    print("\n" + "=" * 40)
-    print("🧪 TESTING INSTALLATION")
-    print("=" * 40)
+    print_section("🧪 TESTING INSTALLATION")
+    warm_thread.join(WARM_JOIN_TIMEOUT)
     if not test_installation():
         print("✗ Installation test failed")
         return 1
     
-    # Success message
-    print("\n" + "=" * 60)
-    print("✅ SETUP COMPLETED SUCCESSFULLY!")
-    print("=" * 60)
-    print()
-    print("🎮 TO PLAY THE GAME:")
-    print("   python3 launch_enhanced_game.py")
-    print("   OR")
-    print("   ./start_game.sh (Linux/Mac)")
-    print("   OR")
-    print("   start_game.bat (Windows)")
-    print()
-    print("📖 TO ADD CUSTOM ASSETS:")
-    print("   See assets/README.txt for details")
-    print()
-    print("🧪 TO TEST COMPONENTS:")
-    print("   python3 test_enhanced_game.py")
-    print()
-    print("🚀 ENJOY THE GAME!")
-    print("   Defend the galaxy and become a Cosmic Legend! 🌌")
-    print()
+    mark_setup_complete()
+    
+    sys.stdout.write(SUCCESS_MESSAGE)
     
     return 0
 
@@ -8,47 +8,50 @@ Test Script for Cosmic Defenders Enhanced
 Simple test to verify all components are working.
 """
 
+import os
 import sys
+import importlib
 import pygame
 from pathlib import Path
 
+from setup_enhanced_game import make_directories
+
+# Add game directory to path (once, however many tests run)
+_GAME_DIR = str(Path(__file__).parent / "game")
+if _GAME_DIR not in sys.path:
+    sys.path.insert(0, _GAME_DIR)
+
+# (module, attribute, label) checked by test_imports
+GAME_MODULES = (
+    ("settings_enhanced", "SCREEN_WIDTH", "Settings"),
+    ("audio_enhanced", "AudioManager", "Audio"),
+    ("leaderboard_enhanced", "LeaderboardManager", "Leaderboard"),
+    ("level_enhanced", "LevelManager", "Level"),
+    ("particles_enhanced", "ParticleManager", "Particle"),
+    ("powerup_enhanced", "PowerUpManager", "Power-up"),
+    ("bullet_enhanced", "BulletManager", "Bullet"),
+    ("enemy_enhanced", "EnemyManager", "Enemy"),
+    ("player_enhanced", "EnhancedPlayer", "Player"),
+    ("ui_enhanced", "UIManager", "UI"),
+)
+
+_MODS = {}
+
+def _module(name):
+    """Import a game module once and reuse it across tests."""
+    module = _MODS.get(name)
+    if module is None:
+        module = _MODS[name] = importlib.import_module(name)
+    return module
+
 def test_imports():
     """Test all game module imports."""
     print("Testing imports...")
 
-    # Add game directory to path
-    sys.path.insert(0, str(Path(__file__).parent / "game"))
-    
     try:
-        from settings_enhanced import SCREEN_WIDTH, SCREEN_HEIGHT, UI_PRIMARY
-        print("✓ Settings module")
-        
-        from audio_enhanced import AudioManager
-        print("✓ Audio module")
-        
-        from leaderboard_enhanced import LeaderboardManager
-        print("✓ Leaderboard module")
-        
-        from level_enhanced import LevelManager
-        print("✓ Level module")
-
-        from particles_enhanced import ParticleManager
-        print("✓ Particle module")
-        
-        from powerup_enhanced import PowerUpManager
-        print("✓ Power-up module")
-        
-        from bullet_enhanced import BulletManager
-        print("✓ Bullet module")
-        
-        from enemy_enhanced import EnemyManager
-        print("✓ Enemy module")
-        
-        from player_enhanced import EnhancedPlayer
-        print("✓ Player module")
-        
-        from ui_enhanced import UIManager
-        print("✓ UI module")
+        for module_name, attr, label in GAME_MODULES:
+            getattr(_module(module_name), attr)
+            print(f"✓ {label} module")
         
         print("✓ All modules imported successfully!")
         return True
@@ -64,20 +67,19 @@ def test_pygame():
     try:
         pygame.init()
         
-        # Test display
-        screen = pygame.display.set_mode((800, 600))
-        pygame.display.set_caption("Test Window")
-        print("✓ Display initialized")
-
-        # Test basic rendering
-        screen.fill((0, 0, 0))
-        pygame.draw.circle(screen, (255, 255, 255), (400, 300), 50)
-        pygame.display.flip()
+        # Test basic rendering offscreen - no window or GPU context needed
+        surface = pygame.Surface((16, 16))
+        pygame.draw.circle(surface, (255, 255, 255), (8, 8), 4)
+        if surface.get_at((8, 8)) != (255, 255, 255, 255):
+            raise RuntimeError("offscreen draw produced the wrong pixel")
         print("✓ Basic rendering works")
         
-        # Test audio
-        pygame.mixer.init()
-        print("✓ Audio system initialized")
+        # Test audio (opening the device is slow, so only on request)
+        if os.environ.get("COSMIC_TEST_AUDIO") == "1":
+            pygame.mixer.init()
+            print("✓ Audio system initialized")
+        else:
+            print("⚠ Audio check skipped (set COSMIC_TEST_AUDIO=1 to run it)")
         
         pygame.quit()
         print("✓ Pygame test completed successfully!")
@@ -92,29 +94,22 @@ def test_game_components():
     print("\nTesting game components...")
     
     try:
-        # Add game directory to path
-        sys.path.insert(0, str(Path(__file__).parent / "game"))
-        
         # Test audio manager
-        from audio_enhanced import AudioManager
-        audio = AudioManager()
+        audio = _module("audio_enhanced").AudioManager()
         print("✓ Audio manager created")
         
         # Test leaderboard
-        from leaderboard_enhanced import LeaderboardManager
-        leaderboard = LeaderboardManager()
+        leaderboard = _module("leaderboard_enhanced").LeaderboardManager()
         leaderboard.add_score("TestPlayer", 1000, "COMMANDER")
         print("✓ Leaderboard manager working")
         
         # Test particle system
-        from particles_enhanced import ParticleManager
-        particles = ParticleManager()
+        particles = _module("particles_enhanced").ParticleManager()
         particles.create_explosion(100, 100, 10)
         print("✓ Particle system working")
         
         # Test level manager
-        from level_enhanced import LevelManager
-        levels = LevelManager()
+        levels = _module("level_enhanced").LevelManager()
         print(f"✓ Level manager - {len(levels.unlocked_levels)} levels unlocked")
         
         print("✓ All components tested successfully!")
@@ -131,8 +126,7 @@ def main():
     print("=" * 50)
     
     # Create directories
-    for directory in ["saves", "assets", "assets/images", "assets/sounds", "assets/fonts"]:
-        Path(directory).mkdir(parents=True, exist_ok=True)
+    make_directories(["saves", "assets", "assets/images", "assets/sounds", "assets/fonts"])
 
     success = True
     
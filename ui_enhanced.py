@@ -13,18 +13,145 @@ Advanced UI system with:
 
 import pygame
 import math
-import time
+import string
+from bisect import bisect_right
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple, Any
 
+try:
+    import numpy as np
+except ImportError:
+    np = None  # NumPy is optional; the background gradient is then built row by row
+
 from settings_enhanced import *
+from settings_enhanced import Mission
+
+# Fixed screen text, pre-rendered into the UI text cache
+INSTRUCTION_LINES = (
+    "CONTROLS:",
+    "WASD / Arrow Keys - Move",
+    "Space - Shoot",
+    "X / Shift - Special Ability (Time Freeze)",
+    "ESC - Pause",
+    "",
+    "POWER-UPS:",
+    "Green - Health Boost",
+    "Cyan - Energy Shield",
+    "Yellow - Rapid Fire",
+    "Purple - Multi Shot",
+    "Orange - Screen Clear",
+    "",
+    "ENEMIES:",
+    "Red - Basic Enemy (100 pts)",
+    "Yellow - Fast Enemy (150 pts)",
+    "Purple - Heavy Enemy (300 pts)",
+    "Green - Zigzag Enemy (200 pts)",
+    "Orange - Boss Enemy (1000 pts)",
+    "",
+    "Press ESC to return to menu"
+)
+PAUSE_LINES = ("Press ESC to resume", "Or click below:")
+GAME_OVER_OPTIONS = ("Press SPACE to play again", "Press ESC for main menu")
+LEVEL_COMPLETE_OPTIONS = ("Press SPACE for next level", "Press ESC for main menu")
+BACK_HINT = "Press ESC to go back"
+# Name input: ASCII characters accepted without a str.isprintable() call
+_PRINTABLE = frozenset(string.printable) - frozenset(string.whitespace[1:])
+MAX_NAME_LENGTH = 20
+# Text cache entries kept before the least recently used are evicted
+TEXT_CACHE_SIZE = 512
+
+MAIN_MENU_ACTIONS = ("start_game", "instructions", "level_select",
+                     "leaderboard", "settings", "daily_missions", "quit")
+SCREEN_TITLES = ("COSMIC DEFENDERS", "ENTER YOUR NAME", "SELECT DIFFICULTY", "SELECT LEVEL",
+                 "INSTRUCTIONS", "SETTINGS", "HALL OF FAME", "DAILY MISSIONS")
+
+# HUD numbers are laid out from per-glyph surfaces; prefixes are glyphs of their own
+HUD_GLYPHS = "0123456789,/-"
+HUD_PREFIXES = {'small': ("Health: ",), 'medium': ("Score: ", "Wave: ")}
+
+LEADERBOARD_HEADERS = ("Rank", "Name", "Score", "Difficulty")
+LEADERBOARD_COLUMNS = (SCREEN_WIDTH // 2 - 200, SCREEN_WIDTH // 2 - 50,
+                       SCREEN_WIDTH // 2 + 50, SCREEN_WIDTH // 2 + 150)
+# Leaderboard rows are cached as one surface each; dropped wholesale past this many
+_LB_ROW_CACHE_LIMIT = 50
+
+# Title glow: the text stamped at the four diagonal offsets of _GLOW_SPREAD pixels
+_GLOW_SPREAD = 2
+
+# Background gradient: sin(2t + 0.01y) == sin(0.01 * (y + 200t)), so animating
+# it is a vertical scroll through one pre-rendered period
+_BG_SCROLL_SPEED = 200
+_BG_PERIOD = 2 * math.pi / 0.01
+
+def _gradient_channels(height: int):
+    """Per-channel uint8 rows (r, g, b) of the background at t = 0 (4-pixel bands)."""
+    if np is not None:
+        blue = (20 + 10 * np.sin(np.arange(height) // 4 * 4 * 0.01)).astype(np.uint8)
+        return blue // 3, blue // 2, blue
+    blue = bytes(int(20 + 10 * math.sin(y // 4 * 4 * 0.01)) for y in range(height))
+    return bytes(v // 3 for v in blue), bytes(v // 2 for v in blue), blue
+
+# pygame-ce's fblits skips the per-item return value and argument checks of blits
+_HAS_FBLITS = hasattr(pygame.Surface, 'fblits')
+
+def _blit_all(screen: pygame.Surface, blit_list: List[Tuple[pygame.Surface, Any]]):
+    """Blit a list of (surface, dest) pairs in one call."""
+    if _HAS_FBLITS:
+        screen.fblits(blit_list)
+    else:
+        screen.blits(blit_list, doreturn=False)
+
+@lru_cache(maxsize=None)
+def _font(path: Optional[str], size: int) -> pygame.font.Font:
+    """Open a font file at a size once per process and share it."""
+    return pygame.font.Font(path, size)
+
+def _convert(surface: pygame.Surface) -> pygame.Surface:
+    """Match the display pixel format once so blits take the fast path."""
+    if pygame.display.get_surface() is not None:
+        return surface.convert_alpha()
+    return surface
+
+def _flatten(blit_list: List[Tuple[pygame.Surface, pygame.Rect]]) -> Tuple[pygame.Surface, Tuple[int, int]]:
+    """Merge (surface, screen rect) pairs into one surface and its screen position."""
+    bounds = blit_list[0][1].unionall([rect for _, rect in blit_list])
+    merged = pygame.Surface(bounds.size, pygame.SRCALPHA)
+    merged.blits([(surface, rect.move(-bounds.x, -bounds.y)) for surface, rect in blit_list],
+                 doreturn=False)
+    return _convert(merged), bounds.topleft
+
+def _draw_mission_row(panel: pygame.Surface, blit_list: list, text, y: int,
+                      mission_text: str, target_text: str, reward_text: str):
+    """Draw one mission background onto panel and queue its three lines of text."""
+    # Mission background
+    mission_rect = pygame.Rect(0, y - 20, panel.get_width(), 80)
+    pygame.draw.rect(panel, UI_SECONDARY, mission_rect, border_radius=10)
+    pygame.draw.rect(panel, UI_PRIMARY, mission_rect, 2, border_radius=10)
+    
+    # Mission text
+    blit_list.append((text('medium', mission_text, WHITE), (20, y - 10)))
+    
+    # Target and reward
+    blit_list.append((text('small', target_text, UI_INFO), (20, y + 15)))
+    blit_list.append((text('small', reward_text, UI_SUCCESS), (20, y + 35)))
 
 class Button:
     """Enhanced button class with animations and effects."""
     
+    # Hover scale is snapped to 1/_SCALE_STEPS so each size is drawn only once
+    _SCALE_STEPS = 32
+    
+    # Background+border and hover overlay keyed by (color, width, height, enabled)
+    _surface_cache: Dict[Tuple, Tuple[pygame.Surface, pygame.Surface]] = {}
+    
     def __init__(self, x: int, y: int, width: int, height: int, text: str, 
                  color: Tuple[int, int, int] = UI_PRIMARY, 
                  text_color: Tuple[int, int, int] = WHITE):
         self.rect = pygame.Rect(x - width // 2, y - height // 2, width, height)
+        # Hit-test bounds as plain ints (right/bottom exclusive, like Rect.collidepoint)
+        self._x1, self._y1 = self.rect.left, self.rect.top
+        self._x2, self._y2 = self.rect.right, self.rect.bottom
         self.text = text
         self.color = color
         self.text_color = text_color
@@ -33,10 +160,16 @@ class Button:
         self.clicked = False
         self.enabled = True
         
-    def update(self, dt: float):
+        # Label surfaces keyed by (font, enabled)
+        self._text_surfaces: Dict[Tuple[pygame.font.Font, bool], pygame.Surface] = {}
+        
+        # Everything render needs for one hover step, keyed by (step, font, enabled)
+        self._frames: Dict[Tuple[int, pygame.font.Font, bool], Tuple] = {}
+        
+    def update(self, dt: float, mouse_pos: Tuple[int, int]):
         """Update button animations."""
-        mouse_pos = pygame.mouse.get_pos()
-        is_hovering = self.rect.collidepoint(mouse_pos) and self.enabled
+        mx, my = mouse_pos
+        is_hovering = self.enabled and self._x1 <= mx < self._x2 and self._y1 <= my < self._y2
         
         # Hover animation
         target_scale = BUTTON_HOVER_SCALE if is_hovering else 1.0
@@ -50,17 +183,76 @@ class Button:
         if not self.enabled:
             return False
             
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            if event.button == 1 and self.rect.collidepoint(event.pos):
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            mx, my = event.pos
+            if self._x1 <= mx < self._x2 and self._y1 <= my < self._y2:
                 self.clicked = True
                 return True
         return False
     
+    def render_key(self) -> Tuple[int, int, bool]:
+        """What render would draw: hover scale step, hover alpha and enabled state."""
+        return (round((self.hover_scale - 1.0) * self._SCALE_STEPS),
+                int(self.hover_alpha * 255), self.enabled)
+    
+    def _get_surfaces(self, width: int, height: int) -> Tuple[pygame.Surface, pygame.Surface]:
+        """Get the background+border and hover overlay for a button size."""
+        key = (self.color, width, height, self.enabled)
+        surfaces = Button._surface_cache.get(key)
+        if surfaces is None:
+            # Button background
+            alpha = 200 if self.enabled else 100
+            base = pygame.Surface((width, height), pygame.SRCALPHA)
+            pygame.draw.rect(base, (*self.color, alpha), 
+                            (0, 0, width, height), border_radius=10)
+            
+            # Border
+            pygame.draw.rect(base, WHITE, 
+                            (0, 0, width, height), 2, border_radius=10)
+            
+            # Hover effect (white, so drawing it over the border leaves the border unchanged)
+            hover = pygame.Surface((width, height), pygame.SRCALPHA)
+            pygame.draw.rect(hover, (255, 255, 255, 255), 
+                           (0, 0, width, height), border_radius=10)
+            
+            surfaces = Button._surface_cache[key] = (_convert(base), _convert(hover))
+        return surfaces
+    
+    def _get_text_surface(self, font: pygame.font.Font) -> pygame.Surface:
+        """Get the label surface, rendered once per font and enabled state."""
+        key = (font, self.enabled)
+        text_surface = self._text_surfaces.get(key)
+        if text_surface is None:
+            text_color = self.text_color if self.enabled else (128, 128, 128)
+            text_surface = _convert(font.render(self.text, True, text_color))
+            self._text_surfaces[key] = text_surface
+        return text_surface
+    
     def render(self, screen: pygame.Surface, font: pygame.font.Font):
         """Render the button with effects."""
+        step = round((self.hover_scale - 1.0) * self._SCALE_STEPS)
+        key = (step, font, self.enabled)
+        frame = self._frames.get(key)
+        if frame is None:
+            frame = self._frames[key] = self._build_frame(step, font)
+        base, hover, text_surface, scaled_pos, text_pos = frame
+        
+        screen.blit(base, scaled_pos)
+        
+        hover_alpha = int(self.hover_alpha * 255)
+        if hover_alpha > 0:
+            hover.set_alpha(hover_alpha)
+            screen.blit(hover, scaled_pos)
+        
+        # Text
+        screen.blit(text_surface, text_pos)
+    
+    def _build_frame(self, step: int, font: pygame.font.Font) -> Tuple:
+        """Get the surfaces and positions for one hover scale step."""
         # Calculate scaled rect
-        scaled_width = int(self.rect.width * self.hover_scale)
-        scaled_height = int(self.rect.height * self.hover_scale)
+        scale = 1.0 + step / self._SCALE_STEPS
+        scaled_width = int(self.rect.width * scale)
+        scaled_height = int(self.rect.height * scale)
         scaled_rect = pygame.Rect(
             self.rect.centerx - scaled_width // 2,
             self.rect.centery - scaled_height // 2,
@@ -68,30 +260,10 @@ class Button:
             scaled_height
         )
         
-        # Button background
-        alpha = 200 if self.enabled else 100
-        button_surface = pygame.Surface((scaled_width, scaled_height), pygame.SRCALPHA)
-        pygame.draw.rect(button_surface, (*self.color, alpha), 
-                        (0, 0, scaled_width, scaled_height), border_radius=10)
-        
-        # Hover effect
-        if self.hover_alpha > 0:
-            hover_surface = pygame.Surface((scaled_width, scaled_height), pygame.SRCALPHA)
-            pygame.draw.rect(hover_surface, (255, 255, 255, int(self.hover_alpha * 255)), 
-                           (0, 0, scaled_width, scaled_height), border_radius=10)
-            button_surface.blit(hover_surface, (0, 0))
-        
-        # Border
-        pygame.draw.rect(button_surface, WHITE, 
-                        (0, 0, scaled_width, scaled_height), 2, border_radius=10)
-        
-        screen.blit(button_surface, scaled_rect)
-        
-        # Text
-        text_color = self.text_color if self.enabled else (128, 128, 128)
-        text_surface = font.render(self.text, True, text_color)
+        base, hover = self._get_surfaces(scaled_width, scaled_height)
+        text_surface = self._get_text_surface(font)
         text_rect = text_surface.get_rect(center=scaled_rect.center)
-        screen.blit(text_surface, text_rect)
+        return base, hover, text_surface, scaled_rect.topleft, text_rect.topleft
 
 class UIManager:
     """Enhanced UI Manager for all interface elements."""
@@ -102,15 +274,59 @@ class UIManager:
         self.buttons = {}
         self.current_menu = None
         self.animation_time = 0
-        self.input_text = ""
+        self._input_buf: List[str] = []
+        self._input_text: Optional[str] = ""
         self.input_active = False
         
+        # Rendered text keyed by (font name, text, color), least recently used first
+        self._text_cache: "OrderedDict[Tuple[str, str, Tuple[int, ...]], pygame.Surface]" = OrderedDict()
+        
+        # White HUD glyph surfaces keyed by font name, then glyph
+        self._glyph_atlas: Dict[str, Dict[str, pygame.Surface]] = {}
+        
+        # Last rendering of each piece of changing text, as (text, surface) keyed by slot
+        self._live_text: Dict[str, Tuple[str, pygame.Surface]] = {}
+        
+        # Mission list display strings, as (missions, [(title, target, reward), ...])
+        self._mission_strings: Optional[Tuple[Tuple[Mission, ...], List[Tuple[str, str, str]]]] = None
+        # The drawn mission list and its screen position, rebuilt with the strings
+        self._mission_panel: Optional[Tuple[pygame.Surface, Tuple[int, int]]] = None
+        
+        # Leaderboard header block, and rows keyed by (rank, name, score, difficulty)
+        self._lb_header: Optional[Tuple[pygame.Surface, Tuple[int, int]]] = None
+        self._lb_row_cache: Dict[Tuple, Tuple[pygame.Surface, Tuple[int, int]]] = {}
+        
+        # Title text and pre-composed glow (alpha baked in) keyed by title
+        self._title_surfs: Dict[str, Tuple[pygame.Surface, pygame.Surface]] = {}
+        
+        # Placement of static items keyed by (size, center)
+        self._rect_cache: Dict[Tuple[Tuple[int, int], Tuple[int, int]], pygame.Rect] = {}
+        
+        # Animated background, scrolled through rather than redrawn
+        self._bg_gradient = self._build_background_gradient()
+        
+        # Full-screen composites of screens with no animation, keyed by screen name.
+        # dirty_rects tells the game loop what to push: None = whole frame, [] = nothing
+        self._static_cached: Dict[str, pygame.Surface] = {}
+        self.dirty_rects: Optional[List[pygame.Rect]] = None
+        
+        # Button layers keyed by menu name, as (button render keys, surface);
+        # only the menu's area of the surface is used
+        self._menu_composites: Dict[str, Tuple[Tuple, pygame.Surface]] = {}
+        self._menu_areas: Dict[str, pygame.Rect] = {}
+        
+        # Dimming layer for the pause screen, created on first pause
+        self._pause_overlay: Optional[pygame.Surface] = None
+        
         # Load fonts
         self._load_fonts()
         
         # Initialize menu buttons
         self._initialize_buttons()
         
+        # Pre-render the static screen text
+        self._warm_text_cache()
+        
         print("UI Manager initialized successfully!")
     
     def _load_fonts(self):
@@ -120,16 +336,111 @@ class UIManager:
             font_path = FONTS_DIR / "game_font.ttf"
             if font_path.exists():
                 for name, size in FONT_SIZES.items():
-                    self.fonts[name] = pygame.font.Font(str(font_path), size)
+                    self.fonts[name] = _font(str(font_path), size)
             else:
                 # Use system fonts
                 for name, size in FONT_SIZES.items():
-                    self.fonts[name] = pygame.font.Font(None, size)
+                    self.fonts[name] = _font(None, size)
         except Exception as e:
             print(f"Error loading fonts: {e}")
             # Fallback to default fonts
             for name, size in FONT_SIZES.items():
-                self.fonts[name] = pygame.font.Font(None, size)
+                self.fonts[name] = _font(None, size)
+    
+    @property
+    def input_text(self) -> str:
+        """The typed name, joined from the input buffer only after it changes."""
+        if self._input_text is None:
+            self._input_text = "".join(self._input_buf)
+        return self._input_text
+    
+    @input_text.setter
+    def input_text(self, text: str):
+        self._input_buf = list(text)
+        self._input_text = text
+    
+    def take_dirty_rects(self) -> Optional[List[pygame.Rect]]:
+        """Get this frame's dirty rects (None for a full update) and reset them."""
+        dirty_rects, self.dirty_rects = self.dirty_rects, None
+        return dirty_rects
+    
+    def has_static_screen(self, name: str) -> bool:
+        """Check whether a static screen composite is cached."""
+        return name in self._static_cached
+    
+    def invalidate_static_screens(self):
+        """Drop cached static screens (call when the screen underneath changes)."""
+        self._static_cached.clear()
+    
+    def _text(self, font_name: str, text: str, color: Tuple[int, ...]) -> pygame.Surface:
+        """Get a rendered text surface, rendering it only on first use."""
+        key = (font_name, text, color)
+        cache = self._text_cache
+        surface = cache.get(key)
+        if surface is None:
+            surface = cache[key] = _convert(self.fonts[font_name].render(text, True, color))
+            if len(cache) > TEXT_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return surface
+    
+    def _live(self, slot: str, font_name: str, text: str, color: Tuple[int, ...]) -> pygame.Surface:
+        """Get a rendering of changing text, re-rendered only when the text changes."""
+        entry = self._live_text.get(slot)
+        if entry is None or entry[0] != text:
+            entry = self._live_text[slot] = (text, _convert(self.fonts[font_name].render(text, True, color)))
+        return entry[1]
+    
+    def _centered(self, surface: pygame.Surface, center: Tuple[int, int]) -> pygame.Rect:
+        """Get the rect centering a surface of this size on center."""
+        key = (surface.get_size(), center)
+        rect = self._rect_cache.get(key)
+        if rect is None:
+            rect = self._rect_cache[key] = surface.get_rect(center=center)
+        return rect
+    
+    def _warm_text_cache(self):
+        """Render the text of the static screens up front."""
+        for line in INSTRUCTION_LINES:
+            if line.endswith(":"):
+                self._text('medium', line, UI_PRIMARY)
+            elif line:
+                self._text('small', line, WHITE)
+        
+        for line in PAUSE_LINES + GAME_OVER_OPTIONS + LEVEL_COMPLETE_OPTIONS + (BACK_HINT,):
+            self._text('medium', line, UI_INFO)
+        
+        self._text('xlarge', "PAUSED", WHITE)
+        self._text('xlarge', "GAME OVER", UI_DANGER)
+        self._text('xlarge', "LEVEL COMPLETE!", UI_SUCCESS)
+        self._text('medium', "NEW HIGH SCORE!", UI_SUCCESS)
+        
+        for title in SCREEN_TITLES:
+            self._get_title_surfaces(title)
+        
+        # Level select labels, so rebuilding the grid on an unlock renders no text
+        for level in range(1, MAX_LEVELS + 1):
+            self._text('medium', str(level), WHITE)
+            self._text('medium', str(level), (128, 128, 128))
+        for req_score in LEVEL_REQUIREMENTS.values():
+            self._text('small', f"{req_score:,}", UI_WARNING)
+        
+        for font_name, prefixes in HUD_PREFIXES.items():
+            self._glyph_atlas[font_name] = {glyph: self._text(font_name, glyph, WHITE)
+                                            for glyph in prefixes + tuple(HUD_GLYPHS)}
+    
+    def _glyph_run(self, font_name: str, prefix: str, value: str,
+                   pos: Tuple[int, int], blit_list: list):
+        """Queue prefix and value glyph by glyph, left to right from pos."""
+        atlas = self._glyph_atlas[font_name]
+        x, y = pos
+        for glyph in (prefix, *value):
+            surface = atlas.get(glyph)
+            if surface is None:
+                surface = atlas[glyph] = self._text(font_name, glyph, WHITE)
+            blit_list.append((surface, (x, y)))
+            x += surface.get_width()
     
     def _initialize_buttons(self):
         """Initialize all menu buttons."""
@@ -147,6 +458,12 @@ class UIManager:
             Button(center_x, start_y + 300, MENU_BUTTON_WIDTH, MENU_BUTTON_HEIGHT, "Quit", UI_DANGER)
         ]
         
+        menu_area = self.buttons['main_menu'][0].rect.unionall(
+            [button.rect for button in self.buttons['main_menu']])
+        self._menu_areas['main_menu'] = menu_area.inflate(
+            int(MENU_BUTTON_WIDTH * (BUTTON_HOVER_SCALE - 1)) + 2,
+            int(MENU_BUTTON_HEIGHT * (BUTTON_HOVER_SCALE - 1)) + 2)
+        
         # Difficulty selection buttons
         self.buttons['difficulty'] = []
         for i, (key, diff) in enumerate(DIFFICULTIES.items()):
@@ -160,41 +477,97 @@ class UIManager:
         self.buttons['difficulty'].append(
             Button(center_x, start_y + 300, MENU_BUTTON_WIDTH, MENU_BUTTON_HEIGHT, "Back", UI_SECONDARY)
         )
+        
+        # Vertically stacked menus: button tops sorted for a bisect hit test
+        self._menu_hit_index: Dict[str, Tuple[List[int], List[int]]] = {}
+        for menu_name, menu_buttons in self.buttons.items():
+            order = sorted(range(len(menu_buttons)), key=lambda i: menu_buttons[i]._y1)
+            self._menu_hit_index[menu_name] = ([menu_buttons[i]._y1 for i in order], order)
+        self._difficulty_keys = tuple(DIFFICULTIES.keys())
+        
+        # Level select hit boxes as (level, x1, y1, x2, y2), right/bottom exclusive
+        levels_per_row = 5
+        grid_x = SCREEN_WIDTH // 2 - (levels_per_row * 80) // 2
+        grid_y = 200
+        self._level_bounds = []
+        for level in range(1, MAX_LEVELS + 1):
+            x = grid_x + (level - 1) % levels_per_row * 80
+            y = grid_y + (level - 1) // levels_per_row * 80
+            self._level_bounds.append((level, x - 30, y - 30, x + 30, y + 30))
+        
+        # Level grid drawings keyed by the unlocked set (changes only on unlock)
+        self._level_grid_origin = (grid_x - 30, grid_y - 30)
+        self._level_grid_size = (levels_per_row * 80 - 20,
+                                 (MAX_LEVELS - 1) // levels_per_row * 80 + 100)
+        self._level_grid_cache: Dict[frozenset, pygame.Surface] = {}
+        
+        self._level_back_button = Button(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100,
+                                         MENU_BUTTON_WIDTH, MENU_BUTTON_HEIGHT, "Back", UI_SECONDARY)
+        back_x1 = SCREEN_WIDTH // 2 - MENU_BUTTON_WIDTH // 2
+        back_y1 = SCREEN_HEIGHT - 130
+        self._level_back_bounds = (back_x1, back_y1, back_x1 + MENU_BUTTON_WIDTH,
+                                   back_y1 + MENU_BUTTON_HEIGHT)
     
     def update(self, dt: float):
         """Update UI animations and effects."""
         self.animation_time += dt
         
         # Update all buttons
+        mouse_pos = pygame.mouse.get_pos()
         for menu_buttons in self.buttons.values():
             if isinstance(menu_buttons, list):
                 for button in menu_buttons:
-                    button.update(dt)
+                    button.update(dt, mouse_pos)
+    
+    def _get_title_surfaces(self, title: str) -> Tuple[pygame.Surface, pygame.Surface]:
+        """Get the title and glow surfaces, rendering them on first use."""
+        surfaces = self._title_surfs.get(title)
+        if surfaces is None:
+            title_surface = _convert(self.fonts['title'].render(title, True, UI_PRIMARY))
+            
+            # Compose the glow once instead of blitting the text four times per frame
+            glow_text = self.fonts['title'].render(title, True, WHITE)
+            spread = _GLOW_SPREAD * 2
+            glow_surface = pygame.Surface((glow_text.get_width() + spread,
+                                           glow_text.get_height() + spread), pygame.SRCALPHA)
+            for offset in ((0, 0), (0, spread), (spread, 0), (spread, spread)):
+                glow_surface.blit(glow_text, offset, special_flags=pygame.BLEND_RGBA_MAX)
+            if hasattr(pygame.transform, 'box_blur'):  # pygame-ce
+                glow_surface = pygame.transform.box_blur(glow_surface, 1)
+            glow_surface = _convert(glow_surface)
+            glow_surface.set_alpha(255 // 4)
+            surfaces = self._title_surfs[title] = (title_surface, glow_surface)
+        return surfaces
     
     def render_animated_title(self, title: str, x: int, y: int, 
                             alpha: int = 255, scale: float = 1.0):
         """Render animated title with effects."""
-        # Create title surface
-        title_surface = self.fonts['title'].render(title, True, UI_PRIMARY)
+        title_surface, glow_surface = self._get_title_surfaces(title)
+        
+        # Common case: full size and opacity, so the cached surfaces are used as-is
+        if scale == 1.0 and alpha == 255:
+            _blit_all(self.screen, [
+                (glow_surface, self._centered(glow_surface, (x, y))),
+                (title_surface, self._centered(title_surface, (x, y)))
+            ])
+            return
         
-        # Apply effects
+        # Apply effects (on copies, leaving the cached surfaces untouched)
         if scale != 1.0:
-            new_size = (int(title_surface.get_width() * scale), 
-                       int(title_surface.get_height() * scale))
-            title_surface = pygame.transform.scale(title_surface, new_size)
+            title_surface = pygame.transform.scale(title_surface, (
+                int(title_surface.get_width() * scale), int(title_surface.get_height() * scale)))
+            glow_surface = pygame.transform.scale(glow_surface, (
+                int(glow_surface.get_width() * scale), int(glow_surface.get_height() * scale)))
+        else:
+            title_surface = title_surface.copy()
+            glow_surface = glow_surface.copy()
         
         title_surface.set_alpha(alpha)
-        
-        # Add glow effect
-        glow_surface = self.fonts['title'].render(title, True, WHITE)
-        if scale != 1.0:
-            glow_surface = pygame.transform.scale(glow_surface, new_size)
         glow_surface.set_alpha(alpha // 4)
         
         # Render glow
-        for offset in [(-2, -2), (-2, 2), (2, -2), (2, 2)]:
-            glow_rect = glow_surface.get_rect(center=(x + offset[0], y + offset[1]))
-            self.screen.blit(glow_surface, glow_rect)
+        glow_rect = glow_surface.get_rect(center=(x, y))
+        self.screen.blit(glow_surface, glow_rect)
         
         # Render main title
         title_rect = title_surface.get_rect(center=(x, y))
@@ -210,26 +583,59 @@ class UIManager:
         self.render_animated_title("COSMIC DEFENDERS", SCREEN_WIDTH // 2, title_y)
         
         # Subtitle
-        subtitle = self.fonts['medium'].render("Enhanced Edition", True, UI_INFO)
+        subtitle = self._text('medium', "Enhanced Edition", UI_INFO)
         subtitle_rect = subtitle.get_rect(center=(SCREEN_WIDTH // 2, title_y + 80))
         self.screen.blit(subtitle, subtitle_rect)
         
-        # Menu buttons with staggered animation
-        for i, button in enumerate(self.buttons['main_menu']):
-            # Staggered entrance animation
-            entrance_delay = i * 0.1
-            if animation_time > entrance_delay:
-                button_alpha = min(1.0, (animation_time - entrance_delay) * 2)
-                button.render(self.screen, self.fonts['medium'])
+        # Menu buttons with staggered entrance animation
+        buttons = [button for i, button in enumerate(self.buttons['main_menu'])
+                   if animation_time > i * 0.1]
+        self._render_menu_composite('main_menu', buttons)
+    
+    def _render_menu_composite(self, menu_name: str, buttons: List[Button]):
+        """Blit a menu's buttons as one layer, redrawn only when a button changes."""
+        state = tuple(button.render_key() for button in buttons)
+        area = self._menu_areas[menu_name]
+        cached = self._menu_composites.get(menu_name)
+        
+        if cached is None:
+            composite = _convert(pygame.Surface(self.screen.get_size(), pygame.SRCALPHA))
+        elif cached[0] != state:
+            composite = cached[1]
+        else:
+            self.screen.blit(cached[1], area, area)
+            return
+        
+        composite.fill((0, 0, 0, 0), area)
+        font = self.fonts['medium']
+        for button in buttons:
+            button.render(composite, font)
+        self._menu_composites[menu_name] = (state, composite)
+        self.screen.blit(composite, area, area)
+    
+    def _clicked_button(self, menu_name: str, event) -> Optional[int]:
+        """Index of the menu button a left click landed on, if any."""
+        if event.type != pygame.MOUSEBUTTONDOWN or event.button != 1:
+            return None
+        
+        mx, my = event.pos
+        tops, order = self._menu_hit_index[menu_name]
+        slot = bisect_right(tops, my) - 1
+        if slot < 0:
+            return None
+        
+        index = order[slot]
+        button = self.buttons[menu_name][index]
+        if button.enabled and button._x1 <= mx < button._x2 and my < button._y2:
+            button.clicked = True
+            return index
+        return None
     
     def handle_main_menu_events(self, event) -> Optional[str]:
         """Handle main menu events."""
-        button_actions = ["start_game", "instructions", "level_select", 
-                         "leaderboard", "settings", "daily_missions", "quit"]
-        
-        for i, button in enumerate(self.buttons['main_menu']):
-            if button.handle_event(event):
-                return button_actions[i]
+        index = self._clicked_button('main_menu', event)
+        if index is not None:
+            return MAIN_MENU_ACTIONS[index]
         
         return None
     
@@ -247,19 +653,19 @@ class UIManager:
         pygame.draw.rect(self.screen, UI_PRIMARY, input_rect, 3, border_radius=10)
         
         # Input text
-        text_surface = self.fonts['large'].render(self.input_text, True, WHITE)
+        text_surface = self._live('name', 'large', self.input_text, WHITE)
         text_rect = text_surface.get_rect(center=input_rect.center)
         self.screen.blit(text_surface, text_rect)
         
         # Cursor
-        if self.input_active and int(time.time() * 2) % 2:
+        if self.input_active and int(self.animation_time * 2) & 1:
             cursor_x = text_rect.right + 5
             pygame.draw.line(self.screen, WHITE, 
                            (cursor_x, input_rect.centery - 15), 
                            (cursor_x, input_rect.centery + 15), 2)
         
         # Instructions
-        instruction = self.fonts['medium'].render("Press ENTER to continue, ESC to go back", True, UI_INFO)
+        instruction = self._text('medium', "Press ENTER to continue, ESC to go back", UI_INFO)
         instruction_rect = instruction.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 100))
         self.screen.blit(instruction, instruction_rect)
     
@@ -271,9 +677,14 @@ class UIManager:
             elif event.key == pygame.K_ESCAPE:
                 return "back"
             elif event.key == pygame.K_BACKSPACE:
-                self.input_text = self.input_text[:-1]
-            elif event.unicode.isprintable() and len(self.input_text) < 20:
-                self.input_text += event.unicode
+                if self._input_buf:
+                    self._input_buf.pop()
+                    self._input_text = None
+            elif len(self._input_buf) < MAX_NAME_LENGTH:
+                char = event.unicode
+                if char in _PRINTABLE or (char > '\x7f' and char.isprintable()):
+                    self._input_buf.append(char)
+                    self._input_text = None
         
         self.input_active = True
         return None
@@ -287,37 +698,36 @@ class UIManager:
         self.render_animated_title("SELECT DIFFICULTY", SCREEN_WIDTH // 2, 150)
         
         # Difficulty buttons with descriptions
+        blit_list = []
         for i, (button, (key, diff)) in enumerate(zip(self.buttons['difficulty'][:-1], DIFFICULTIES.items())):
             button.render(self.screen, self.fonts['medium'])
             
             # Description
             desc_y = button.rect.centery + 35
-            desc_surface = self.fonts['small'].render(diff['description'], True, UI_INFO)
-            desc_rect = desc_surface.get_rect(center=(SCREEN_WIDTH // 2, desc_y))
-            self.screen.blit(desc_surface, desc_rect)
+            desc_surface = self._text('small', diff['description'], UI_INFO)
+            blit_list.append((desc_surface, self._centered(desc_surface, (SCREEN_WIDTH // 2, desc_y))))
             
             # Score multiplier
             mult_text = f"Score x{diff['score_mult']}"
-            mult_surface = self.fonts['small'].render(mult_text, True, diff['color'])
-            mult_rect = mult_surface.get_rect(center=(SCREEN_WIDTH // 2 + 150, button.rect.centery))
-            self.screen.blit(mult_surface, mult_rect)
+            mult_surface = self._text('small', mult_text, diff['color'])
+            blit_list.append((mult_surface, self._centered(
+                mult_surface, (SCREEN_WIDTH // 2 + 150, button.rect.centery))))
+        _blit_all(self.screen, blit_list)
         
         # Back button
         self.buttons['difficulty'][-1].render(self.screen, self.fonts['medium'])
     
     def handle_difficulty_select_events(self, event) -> Optional[str]:
         """Handle difficulty selection events."""
-        difficulty_keys = list(DIFFICULTIES.keys())
-        
-        for i, button in enumerate(self.buttons['difficulty'][:-1]):
-            if button.handle_event(event):
-                return difficulty_keys[i]
+        index = self._clicked_button('difficulty', event)
+        if index is None:
+            return None
         
         # Back button
-        if self.buttons['difficulty'][-1].handle_event(event):
+        if index == len(self._difficulty_keys):
             return "back"
         
-        return None
+        return self._difficulty_keys[index]
     
     def render_level_select(self, unlocked_levels: set):
         """Render level selection screen."""
@@ -328,69 +738,60 @@ class UIManager:
         self.render_animated_title("SELECT LEVEL", SCREEN_WIDTH // 2, 100)
         
         # Level grid
-        levels_per_row = 5
-        start_x = SCREEN_WIDTH // 2 - (levels_per_row * 80) // 2
-        start_y = 200
+        unlocked = frozenset(unlocked_levels)
+        grid = self._level_grid_cache.get(unlocked)
+        if grid is None:
+            grid = self._level_grid_cache[unlocked] = self._build_level_grid(unlocked)
+        self.screen.blit(grid, self._level_grid_origin)
         
-        for level in range(1, MAX_LEVELS + 1):
-            row = (level - 1) // levels_per_row
-            col = (level - 1) % levels_per_row
-            
-            x = start_x + col * 80
-            y = start_y + row * 80
+        # Back button
+        self._level_back_button.render(self.screen, self.fonts['medium'])
+    
+    def _build_level_grid(self, unlocked_levels: frozenset) -> pygame.Surface:
+        """Draw the level tiles, numbers and unlock scores onto one surface."""
+        grid = pygame.Surface(self._level_grid_size, pygame.SRCALPHA)
+        origin_x, origin_y = self._level_grid_origin
+        
+        blit_list = []
+        for level, x1, y1, x2, y2 in self._level_bounds:
+            x = (x1 + x2) // 2 - origin_x
+            y = (y1 + y2) // 2 - origin_y
             
             # Level button
             is_unlocked = level in unlocked_levels
             color = UI_SUCCESS if is_unlocked else UI_SECONDARY
             
             level_rect = pygame.Rect(x - 30, y - 30, 60, 60)
-            pygame.draw.rect(self.screen, color, level_rect, border_radius=10)
-            pygame.draw.rect(self.screen, WHITE, level_rect, 2, border_radius=10)
+            pygame.draw.rect(grid, color, level_rect, border_radius=10)
+            pygame.draw.rect(grid, WHITE, level_rect, 2, border_radius=10)
             
             # Level number
             text_color = WHITE if is_unlocked else (128, 128, 128)
-            level_text = self.fonts['medium'].render(str(level), True, text_color)
-            level_text_rect = level_text.get_rect(center=level_rect.center)
-            self.screen.blit(level_text, level_text_rect)
+            level_text = self._text('medium', str(level), text_color)
+            blit_list.append((level_text, level_text.get_rect(center=level_rect.center)))
             
             # Required score for locked levels
             if not is_unlocked and level in LEVEL_REQUIREMENTS:
                 req_score = LEVEL_REQUIREMENTS[level]
-                req_text = self.fonts['small'].render(f"{req_score:,}", True, UI_WARNING)
-                req_rect = req_text.get_rect(center=(x, y + 45))
-                self.screen.blit(req_text, req_rect)
+                req_text = self._text('small', f"{req_score:,}", UI_WARNING)
+                blit_list.append((req_text, req_text.get_rect(center=(x, y + 45))))
+        _blit_all(grid, blit_list)
         
-        # Back button
-        back_button = Button(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100, 
-                           MENU_BUTTON_WIDTH, MENU_BUTTON_HEIGHT, "Back", UI_SECONDARY)
-        back_button.render(self.screen, self.fonts['medium'])
+        return _convert(grid)
     
     def handle_level_select_events(self, event, unlocked_levels: set) -> Optional[int]:
         """Handle level selection events."""
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            # Check level buttons
-            levels_per_row = 5
-            start_x = SCREEN_WIDTH // 2 - (levels_per_row * 80) // 2
-            start_y = 200
+            mx, my = event.pos
             
-            for level in range(1, MAX_LEVELS + 1):
-                if level not in unlocked_levels:
-                    continue
-                    
-                row = (level - 1) // levels_per_row
-                col = (level - 1) % levels_per_row
-                
-                x = start_x + col * 80
-                y = start_y + row * 80
-                
-                level_rect = pygame.Rect(x - 30, y - 30, 60, 60)
-                if level_rect.collidepoint(event.pos):
-                    return level
+            # Check level buttons
+            for level, x1, y1, x2, y2 in self._level_bounds:
+                if x1 <= mx < x2 and y1 <= my < y2:
+                    return level if level in unlocked_levels else None
             
             # Check back button
-            back_rect = pygame.Rect(SCREEN_WIDTH // 2 - MENU_BUTTON_WIDTH // 2, 
-                                  SCREEN_HEIGHT - 130, MENU_BUTTON_WIDTH, MENU_BUTTON_HEIGHT)
-            if back_rect.collidepoint(event.pos):
+            x1, y1, x2, y2 = self._level_back_bounds
+            if x1 <= mx < x2 and y1 <= my < y2:
                 return "back"
         
         return None
@@ -417,25 +818,42 @@ class UIManager:
         
         pygame.draw.rect(self.screen, health_color, fill_rect, border_radius=5)
         
+        blit_list = []
+        
         # Health text
-        health_text = self.fonts['small'].render(f"Health: {health}/{max_health}", True, WHITE)
-        self.screen.blit(health_text, (HUD_MARGIN, HUD_MARGIN + HEALTH_BAR_HEIGHT + 5))
+        self._glyph_run('small', "Health: ", f"{health}/{max_health}",
+                        (HUD_MARGIN, HUD_MARGIN + HEALTH_BAR_HEIGHT + 5), blit_list)
         
         # Score
-        score_text = self.fonts['medium'].render(f"Score: {score:,}", True, WHITE)
-        self.screen.blit(score_text, (HUD_MARGIN, HUD_MARGIN + 50))
+        self._glyph_run('medium', "Score: ", f"{score:,}", (HUD_MARGIN, HUD_MARGIN + 50), blit_list)
         
         # Wave
-        wave_text = self.fonts['medium'].render(f"Wave: {wave}", True, WHITE)
-        self.screen.blit(wave_text, (HUD_MARGIN, HUD_MARGIN + 80))
+        self._glyph_run('medium', "Wave: ", str(wave), (HUD_MARGIN, HUD_MARGIN + 80), blit_list)
+        
+        _blit_all(self.screen, blit_list)
+    
+    def _build_background_gradient(self) -> pygame.Surface:
+        """Pre-render one gradient period plus a screen height of overlap."""
+        height = SCREEN_HEIGHT + int(math.ceil(_BG_PERIOD))
+        red, green, blue = _gradient_channels(height)
+        
+        # Interleave the channel rows into a packed 1-pixel-wide RGB strip
+        if np is not None:
+            rgb = np.stack((red, green, blue), axis=1).tobytes()
+        else:
+            rgb = bytes(value for pixel in zip(red, green, blue) for value in pixel)
+        strip = pygame.image.frombuffer(rgb, (1, height), 'RGB')
+        
+        gradient = pygame.transform.scale(strip, (SCREEN_WIDTH, height))
+        if pygame.display.get_surface() is not None:
+            gradient = gradient.convert()
+        return gradient
     
     def _render_animated_background(self, time: float):
         """Render animated background effects."""
         # Animated gradient
-        for y in range(0, SCREEN_HEIGHT, 4):
-            intensity = int(20 + 10 * math.sin(time * 2 + y * 0.01))
-            color = (intensity // 3, intensity // 2, intensity)
-            pygame.draw.line(self.screen, color, (0, y), (SCREEN_WIDTH, y), 4)
+        offset = int(time * _BG_SCROLL_SPEED % _BG_PERIOD)
+        self.screen.blit(self._bg_gradient, (0, 0), (0, offset, SCREEN_WIDTH, SCREEN_HEIGHT))
     
     def render_instructions(self):
         """Render instructions screen."""
@@ -444,73 +862,50 @@ class UIManager:
         # Title
         self.render_animated_title("INSTRUCTIONS", SCREEN_WIDTH // 2, 80)
         
-        # Instructions content
-        instructions = [
-            "CONTROLS:",
-            "WASD / Arrow Keys - Move",
-            "Space - Shoot",
-            "X / Shift - Special Ability (Time Freeze)",
-            "ESC - Pause",
-            "",
-            "POWER-UPS:",
-            "Green - Health Boost",
-            "Cyan - Energy Shield",
-            "Yellow - Rapid Fire",
-            "Purple - Multi Shot",
-            "Orange - Screen Clear",
-            "",
-            "ENEMIES:",
-            "Red - Basic Enemy (100 pts)",
-            "Yellow - Fast Enemy (150 pts)",
-            "Purple - Heavy Enemy (300 pts)",
-            "Green - Zigzag Enemy (200 pts)",
-            "Orange - Boss Enemy (1000 pts)",
-            "",
-            "Press ESC to return to menu"
-        ]
-        
         y_offset = 150
-        for line in instructions:
+        for line in INSTRUCTION_LINES:
             if line == "":
                 y_offset += 10
                 continue
             
             if line.endswith(":"):
-                color = UI_PRIMARY
-                font = self.fonts['medium']
+                text_surface = self._text('medium', line, UI_PRIMARY)
             else:
-                color = WHITE
-                font = self.fonts['small']
-            
-            text_surface = font.render(line, True, color)
+                text_surface = self._text('small', line, WHITE)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
             self.screen.blit(text_surface, text_rect)
             y_offset += 25
     
     def render_pause_menu(self):
         """Render pause menu overlay."""
+        cached = self._static_cached.get('pause')
+        if cached is not None:
+            # Nothing on the pause screen moves, so there is nothing to push
+            self.screen.blit(cached, (0, 0))
+            self.dirty_rects = []
+            return
+        
         # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))
-        self.screen.blit(overlay, (0, 0))
+        if self._pause_overlay is None:
+            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, 128))
+            self._pause_overlay = _convert(overlay)
+        self.screen.blit(self._pause_overlay, (0, 0))
         
         # Pause title
-        pause_text = self.fonts['xlarge'].render("PAUSED", True, WHITE)
+        pause_text = self._text('xlarge', "PAUSED", WHITE)
         pause_rect = pause_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 100))
         self.screen.blit(pause_text, pause_rect)
         
         # Instructions
-        instructions = [
-            "Press ESC to resume",
-            "Or click below:"
-        ]
-        
         y_offset = SCREEN_HEIGHT // 2 - 50
-        for instruction in instructions:
-            text_surface = self.fonts['medium'].render(instruction, True, UI_INFO)
+        for instruction in PAUSE_LINES:
+            text_surface = self._text('medium', instruction, UI_INFO)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
             self.screen.blit(text_surface, text_rect)
             y_offset += 40
+        
+        self._static_cached['pause'] = self.screen.copy()
     
     def handle_pause_menu_events(self, event) -> Optional[str]:
         """Handle pause menu events."""
@@ -536,7 +931,7 @@ class UIManager:
         
         for name, value in settings_items:
             # Label
-            label_surface = self.fonts['medium'].render(name, True, WHITE)
+            label_surface = self._text('medium', name, WHITE)
             self.screen.blit(label_surface, (SCREEN_WIDTH // 2 - 200, y_offset))
             
             # Volume bar
@@ -548,13 +943,13 @@ class UIManager:
             pygame.draw.rect(self.screen, UI_PRIMARY, fill_rect, border_radius=5)
             
             # Value text
-            value_text = self.fonts['small'].render(f"{int(value * 100)}%", True, WHITE)
+            value_text = self._text('small', f"{int(value * 100)}%", WHITE)
             self.screen.blit(value_text, (SCREEN_WIDTH // 2 + 170, y_offset + 5))
             
             y_offset += 60
         
         # Back button
-        back_text = self.fonts['medium'].render("Press ESC to go back", True, UI_INFO)
+        back_text = self._text('medium', BACK_HINT, UI_INFO)
         back_rect = back_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100))
         self.screen.blit(back_text, back_rect)
     
@@ -564,6 +959,36 @@ class UIManager:
             return "back"
         return None
     
+    def _build_leaderboard_header(self) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Render the column headers and separator line as one surface."""
+        y_offset = 180
+        parts = []
+        for x, header in zip(LEADERBOARD_COLUMNS, LEADERBOARD_HEADERS):
+            header_surface = self._text('medium', header, UI_PRIMARY)
+            parts.append((header_surface, header_surface.get_rect(center=(x, y_offset))))
+        
+        # Separator line
+        line = pygame.Surface((501, 2))
+        line.fill(UI_PRIMARY)
+        parts.append((line, line.get_rect(topleft=(SCREEN_WIDTH // 2 - 250, y_offset + 25))))
+        return _flatten(parts)
+    
+    def _build_leaderboard_row(self, key: Tuple, y_offset: int) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Render one leaderboard row (rank, name, score, difficulty) as one surface."""
+        i, name, score, difficulty = key
+        rank_color = UI_WARNING if i < 3 else WHITE
+        diff_color = DIFFICULTIES.get(difficulty, {}).get('color', WHITE)
+        
+        font = self.fonts['medium']
+        surfaces = (
+            self._text('medium', f"#{i + 1}", rank_color),
+            font.render(name, True, WHITE),
+            font.render(f"{score:,}", True, UI_SUCCESS),
+            font.render(difficulty, True, diff_color)
+        )
+        return _flatten([(surface, surface.get_rect(center=(x, y_offset)))
+                         for x, surface in zip(LEADERBOARD_COLUMNS, surfaces)])
+    
     def render_leaderboard(self, leaderboard_data: List[Dict]):
         """Render leaderboard screen."""
         self._render_animated_background(self.animation_time)
@@ -571,86 +996,55 @@ class UIManager:
         # Title
         self.render_animated_title("HALL OF FAME", SCREEN_WIDTH // 2, 100)
 
-        # Headers
-        headers = ["Rank", "Name", "Score", "Difficulty"]
-        header_x_positions = [SCREEN_WIDTH // 2 - 200, SCREEN_WIDTH // 2 - 50, 
-                             SCREEN_WIDTH // 2 + 50, SCREEN_WIDTH // 2 + 150]
-        
-        y_offset = 180
-        for i, header in enumerate(headers):
-            header_surface = self.fonts['medium'].render(header, True, UI_PRIMARY)
-            header_rect = header_surface.get_rect(center=(header_x_positions[i], y_offset))
-            self.screen.blit(header_surface, header_rect)
-
-        # Separator line
-        pygame.draw.line(self.screen, UI_PRIMARY,
-                        (SCREEN_WIDTH // 2 - 250, y_offset + 25),
-                        (SCREEN_WIDTH // 2 + 250, y_offset + 25), 2)
+        # Headers and separator line
+        if self._lb_header is None:
+            self._lb_header = self._build_leaderboard_header()
+        blit_list = [self._lb_header]
         
         # Leaderboard entries
-        y_offset += 50
+        row_cache = self._lb_row_cache
+        if len(row_cache) > _LB_ROW_CACHE_LIMIT:
+            row_cache.clear()
+        y_offset = 230
         for i, entry in enumerate(leaderboard_data[:10]):  # Top 10
-            rank_color = UI_WARNING if i < 3 else WHITE
-            
-            # Rank
-            rank_surface = self.fonts['medium'].render(f"#{i + 1}", True, rank_color)
-            rank_rect = rank_surface.get_rect(center=(header_x_positions[0], y_offset))
-            self.screen.blit(rank_surface, rank_rect)
-            
-            # Name
-            name_surface = self.fonts['medium'].render(entry['name'], True, WHITE)
-            name_rect = name_surface.get_rect(center=(header_x_positions[1], y_offset))
-            self.screen.blit(name_surface, name_rect)
-            
-            # Score
-            score_surface = self.fonts['medium'].render(f"{entry['score']:,}", True, UI_SUCCESS)
-            score_rect = score_surface.get_rect(center=(header_x_positions[2], y_offset))
-            self.screen.blit(score_surface, score_rect)
-            
-             # Difficulty
-            diff_color = DIFFICULTIES.get(entry['difficulty'], {}).get('color', WHITE)
-            diff_surface = self.fonts['medium'].render(entry['difficulty'], True, diff_color)
-            diff_rect = diff_surface.get_rect(center=(header_x_positions[3], y_offset))
-            self.screen.blit(diff_surface, diff_rect)
-            
+            key = (i, entry['name'], entry['score'], entry['difficulty'])
+            row = row_cache.get(key)
+            if row is None:
+                row = row_cache[key] = self._build_leaderboard_row(key, y_offset)
+            blit_list.append(row)
             y_offset += 40
         
         # Back instruction
-        back_text = self.fonts['medium'].render("Press ESC to go back", True, UI_INFO)
-        back_rect = back_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))
-        self.screen.blit(back_text, back_rect)
+        back_text = self._text('medium', BACK_HINT, UI_INFO)
+        blit_list.append((back_text, self._centered(back_text, (SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))))
+        _blit_all(self.screen, blit_list)
     
     def render_game_over(self, score: int, high_score: int):
         """Render game over screen."""
         self._render_animated_background(self.animation_time)
         
         # Game Over title
-        game_over_text = self.fonts['xlarge'].render("GAME OVER", True, UI_DANGER)
+        game_over_text = self._text('xlarge', "GAME OVER", UI_DANGER)
         game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, 200))
         self.screen.blit(game_over_text, game_over_rect)
         
         # Score
-        score_text = self.fonts['large'].render(f"Final Score: {score:,}", True, WHITE)
+        score_text = self._live('final_score', 'large', f"Final Score: {score:,}", WHITE)
         score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, 300))
         self.screen.blit(score_text, score_rect)
         
         # High score
         if score >= high_score:
-            hs_text = self.fonts['medium'].render("NEW HIGH SCORE!", True, UI_SUCCESS)
+            hs_text = self._text('medium', "NEW HIGH SCORE!", UI_SUCCESS)
         else:
-            hs_text = self.fonts['medium'].render(f"High Score: {high_score:,}", True, UI_INFO)
+            hs_text = self._live('high_score', 'medium', f"High Score: {high_score:,}", UI_INFO)
         hs_rect = hs_text.get_rect(center=(SCREEN_WIDTH // 2, 350))
         self.screen.blit(hs_text, hs_rect)
         
         # Options
-        options = [
-            "Press SPACE to play again",
-            "Press ESC for main menu"
-        ]
-        
         y_offset = 450
-        for option in options:
-            option_surface = self.fonts['medium'].render(option, True, UI_INFO)
+        for option in GAME_OVER_OPTIONS:
+            option_surface = self._text('medium', option, UI_INFO)
             option_rect = option_surface.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
             self.screen.blit(option_surface, option_rect)
             y_offset += 40
@@ -669,29 +1063,24 @@ class UIManager:
         self._render_animated_background(self.animation_time)
         
         # Level Complete title
-        complete_text = self.fonts['xlarge'].render("LEVEL COMPLETE!", True, UI_SUCCESS)
+        complete_text = self._text('xlarge', "LEVEL COMPLETE!", UI_SUCCESS)
         complete_rect = complete_text.get_rect(center=(SCREEN_WIDTH // 2, 200))
         self.screen.blit(complete_text, complete_rect)
         
         # Level info
-        level_text = self.fonts['large'].render(f"Level {level}", True, WHITE)
+        level_text = self._text('large', f"Level {level}", WHITE)
         level_rect = level_text.get_rect(center=(SCREEN_WIDTH // 2, 280))
         self.screen.blit(level_text, level_rect)
         
         # Score
-        score_text = self.fonts['medium'].render(f"Score: {score:,}", True, UI_INFO)
+        score_text = self._live('level_score', 'medium', f"Score: {score:,}", UI_INFO)
         score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, 330))
         self.screen.blit(score_text, score_rect)
         
         # Options
-        options = [
-            "Press SPACE for next level",
-            "Press ESC for main menu"
-        ]
-        
         y_offset = 400
-        for option in options:
-            option_surface = self.fonts['medium'].render(option, True, UI_INFO)
+        for option in LEVEL_COMPLETE_OPTIONS:
+            option_surface = self._text('medium', option, UI_INFO)
             option_rect = option_surface.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
             self.screen.blit(option_surface, option_rect)
             y_offset += 40
@@ -705,7 +1094,37 @@ class UIManager:
                 return "main_menu"
         return None
     
-    def render_daily_missions(self, missions: List[Dict]):
+    def _prepare_mission_strings(self, missions: Tuple[Mission, ...]):
+        """Format the mission list text once per set of missions."""
+        self._mission_strings = (missions, [
+            (f"Mission {i + 1}: {mission.type.title()}",
+             f"Target: {mission.target}",
+             f"Reward: {mission.reward.replace('_', ' ').title()}")
+            for i, mission in enumerate(missions)
+        ])
+        self._mission_panel = None
+    
+    def _build_mission_panel(self) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Draw the mission backgrounds and text onto one surface."""
+        panel_x, panel_y = SCREEN_WIDTH // 2 - 300, 180
+        
+        # Rows are 100 px apart; rows starting below the screen are never drawn
+        visible_rows = (SCREEN_HEIGHT - panel_y - 1) // 100 + 1
+        mission_strings = self._mission_strings[1][:visible_rows]
+        panel = pygame.Surface((600, max(1, len(mission_strings) * 100 - 20)), pygame.SRCALPHA)
+        
+        # Row text baselines, 100 px apart
+        row_ys = range(20, 20 + len(mission_strings) * 100, 100)
+        
+        text = self._text
+        blit_list = []
+        for y_offset, (mission_text, target_text, reward_text) in zip(row_ys, mission_strings):
+            _draw_mission_row(panel, blit_list, text, y_offset, mission_text, target_text, reward_text)
+        _blit_all(panel, blit_list)
+        
+        return _convert(panel), (panel_x, panel_y)
+    
+    def render_daily_missions(self, missions: Tuple[Mission, ...]):
         """Render daily missions screen."""
         self._render_animated_background(self.animation_time)
         
@@ -713,31 +1132,14 @@ class UIManager:
         self.render_animated_title("DAILY MISSIONS", SCREEN_WIDTH // 2, 100)
         
         # Mission list
-        y_offset = 200
-        for i, mission in enumerate(missions):
-            # Mission background
-            mission_rect = pygame.Rect(SCREEN_WIDTH // 2 - 300, y_offset - 20, 600, 80)
-            pygame.draw.rect(self.screen, UI_SECONDARY, mission_rect, border_radius=10)
-            pygame.draw.rect(self.screen, UI_PRIMARY, mission_rect, 2, border_radius=10)
-            
-            # Mission text
-            mission_text = f"Mission {i + 1}: {mission['type'].title()}"
-            text_surface = self.fonts['medium'].render(mission_text, True, WHITE)
-            self.screen.blit(text_surface, (SCREEN_WIDTH // 2 - 280, y_offset - 10))
-            
-            # Target and reward
-            target_text = f"Target: {mission['target']}"
-            reward_text = f"Reward: {mission['reward'].replace('_', ' ').title()}"
-            
-            target_surface = self.fonts['small'].render(target_text, True, UI_INFO)
-            reward_surface = self.fonts['small'].render(reward_text, True, UI_SUCCESS)
-            
-            self.screen.blit(target_surface, (SCREEN_WIDTH // 2 - 280, y_offset + 15))
-            self.screen.blit(reward_surface, (SCREEN_WIDTH // 2 - 280, y_offset + 35))
-
-            y_offset += 100
-
+        if self._mission_strings is None or self._mission_strings[0] != missions:
+            self._prepare_mission_strings(missions)
+        
+        if self._mission_panel is None:
+            self._mission_panel = self._build_mission_panel()
+        blit_list = [self._mission_panel]
+        
         # Back instruction
-        back_text = self.fonts['medium'].render("Press ESC to go back", True, UI_INFO)
-        back_rect = back_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))
-        self.screen.blit(back_text, back_rect)
+        back_text = self._text('medium', BACK_HINT, UI_INFO)
+        blit_list.append((back_text, self._centered(back_text, (SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))))
+        _blit_all(self.screen, blit_list)